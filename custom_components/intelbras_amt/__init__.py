@@ -65,10 +65,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Create coordinator
-    coordinator = AMTCoordinator(hass, server, scan_interval)
+    coordinator = AMTCoordinator(hass, entry, server, scan_interval)
 
     # Don't wait for first refresh - panel may not be connected yet
-    # The coordinator will return disconnected status until panel connects
+    # Entities stay unavailable until the panel connects and a poll succeeds
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "control_server": control_server,
@@ -12,7 +12,6 @@ from homeassistant.components.alarm_control_panel import (
     CodeFormat,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -20,16 +19,14 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DATA_ARMED,
-    DATA_CONNECTED,
-    DATA_MODEL_NAME,
     DATA_PARTITIONS,
     DATA_SIREN,
     DATA_STAY,
     DATA_TRIGGERED,
     DOMAIN,
-    ENTITY_PREFIX,
     MAX_PARTITIONS,
     PARTITION_NAMES,
+    PARTITION_NAMES_LOWER,
 )
 from .coordinator import AMTCoordinator
 
@@ -50,8 +47,14 @@ async def async_setup_entry(
 
     # Add partition alarm panels
     for partition_idx in range(MAX_PARTITIONS):
-        partition_name = PARTITION_NAMES[partition_idx]
-        entities.append(AMTPartitionAlarmPanel(coordinator, entry, partition_name))
+        entities.append(
+            AMTPartitionAlarmPanel(
+                coordinator,
+                entry,
+                PARTITION_NAMES[partition_idx],
+                PARTITION_NAMES_LOWER[partition_idx],
+            )
+        )
 
     async_add_entities(entities)
 
@@ -75,42 +78,23 @@ class AMTAlarmControlPanel(CoordinatorEntity[AMTCoordinator], AlarmControlPanelE
     ) -> None:
         """Initialize the alarm control panel."""
         super().__init__(coordinator)
-        self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_alarm_panel"
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
+        return self.coordinator.device_info
 
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Return the state of the alarm."""
-        if not self.coordinator.data:
-            return None
-
-        if not self.coordinator.data.get(DATA_CONNECTED, False):
+        data = self.coordinator.data
+        if not data:
             return None
 
-        armed = self.coordinator.data.get(DATA_ARMED, False)
-        triggered = self.coordinator.data.get(DATA_TRIGGERED, False)
-        siren_on = self.coordinator.data.get(DATA_SIREN, False)
+        armed = data.get(DATA_ARMED, False)
+        triggered = data.get(DATA_TRIGGERED, False)
+        siren_on = data.get(DATA_SIREN, False)
 
         # Only show TRIGGERED if:
         # - Siren is currently on, OR
@@ -120,10 +104,10 @@ class AMTAlarmControlPanel(CoordinatorEntity[AMTCoordinator], AlarmControlPanelE
 
         if armed:
             # Check central stay flag OR any partition in stay mode
-            stay = self.coordinator.data.get(DATA_STAY, False)
+            stay = data.get(DATA_STAY, False)
             if not stay:
                 # Check if any armed partition is in stay mode
-                partitions = self.coordinator.data.get(DATA_PARTITIONS, {})
+                partitions = data.get(DATA_PARTITIONS, {})
                 for part_data in partitions.values():
                     if part_data.get("armed") and part_data.get("stay"):
                         stay = True
@@ -167,50 +151,32 @@ class AMTPartitionAlarmPanel(CoordinatorEntity[AMTCoordinator], AlarmControlPane
         coordinator: AMTCoordinator,
         entry: ConfigEntry,
         partition_name: str,
+        partition_id: str,
     ) -> None:
         """Initialize the partition alarm control panel."""
         super().__init__(coordinator)
-        self._entry = entry
         self._partition_name = partition_name
-        self._attr_unique_id = f"{entry.entry_id}_partition_{partition_name.lower()}_panel"
+        self._attr_unique_id = f"{entry.entry_id}_partition_{partition_id}_panel"
         self._attr_name = f"Partição {partition_name}"
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
+        return self.coordinator.device_info
 
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Return the state of the partition."""
-        if not self.coordinator.data:
-            return None
-
-        if not self.coordinator.data.get(DATA_CONNECTED, False):
+        data = self.coordinator.data
+        if not data:
             return None
 
-        partitions = self.coordinator.data.get(DATA_PARTITIONS, {})
+        partitions = data.get(DATA_PARTITIONS, {})
         partition_data = partitions.get(self._partition_name, {})
 
         armed = partition_data.get("armed", False)
         triggered = partition_data.get("triggered", False)
-        siren_on = self.coordinator.data.get(DATA_SIREN, False)
+        siren_on = data.get(DATA_SIREN, False)
 
         # Show TRIGGERED if siren is on or partition is armed and triggered
         if siren_on or (armed and triggered):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from itertools import chain
 import logging
 from typing import Any
 
@@ -10,43 +11,35 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PORT, EntityCategory
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    DATA_AC_POWER,
     DATA_AUX_OVERLOAD,
     DATA_BATTERY_ABSENT,
-    DATA_BATTERY_CONNECTED,
     DATA_BATTERY_LOW,
     DATA_BATTERY_SHORT,
     DATA_COMM_FAILURE,
-    DATA_CONNECTED,
-    DATA_MAX_ZONES,
-    DATA_MODEL_NAME,
-    DATA_PARTITIONS,
     DATA_PHONE_LINE_CUT,
-    DATA_PROBLEM,
-    DATA_SIREN,
     DATA_SIREN_SHORT,
     DATA_SIREN_WIRE_CUT,
-    DATA_ZONES_BYPASSED,
-    DATA_ZONES_LOW_BATTERY,
-    DATA_ZONES_OPEN,
-    DATA_ZONES_SHORT_CIRCUIT,
-    DATA_ZONES_TAMPER,
-    DATA_ZONES_VIOLATED,
     DOMAIN,
-    ENTITY_PREFIX,
     MAX_PARTITIONS,
     MAX_ZONES_4010,
     MAX_ZONES_LOW_BATTERY,
     MAX_ZONES_SHORT_CIRCUIT,
     MAX_ZONES_TAMPER,
     PARTITION_NAMES,
+    PARTITION_NAMES_LOWER,
+    ZONE_BYPASSED_ID_SUFFIXES,
+    ZONE_BYPASSED_NAMES,
+    ZONE_OPEN_ID_SUFFIXES,
+    ZONE_OPEN_NAMES,
+    ZONE_VIOLATED_ID_SUFFIXES,
+    ZONE_VIOLATED_NAMES,
 )
 from .coordinator import AMTCoordinator
 
@@ -61,59 +54,49 @@ async def async_setup_entry(
     """Set up binary sensors from a config entry."""
     coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    entities: list[BinarySensorEntity] = []
-
-    # Determine max zones from coordinator data
-    max_zones = MAX_ZONES_4010
-    if coordinator.data:
-        max_zones = coordinator.data.get(DATA_MAX_ZONES, MAX_ZONES_4010)
-
-    # Zone sensors (open, violated, bypassed)
-    for zone_num in range(1, max_zones + 1):
-        entities.append(AMTZoneOpenSensor(coordinator, entry, zone_num))
-        entities.append(AMTZoneViolatedSensor(coordinator, entry, zone_num))
-        entities.append(AMTZoneBypassedSensor(coordinator, entry, zone_num))
-
-    # Zone tamper sensors (zones 1-18)
-    for zone_num in range(1, MAX_ZONES_TAMPER + 1):
-        entities.append(AMTZoneTamperSensor(coordinator, entry, zone_num))
-
-    # Zone short-circuit sensors (zones 1-18)
-    for zone_num in range(1, MAX_ZONES_SHORT_CIRCUIT + 1):
-        entities.append(AMTZoneShortCircuitSensor(coordinator, entry, zone_num))
-
-    # Zone low battery sensors (wireless zones 1-40)
-    for zone_num in range(1, MAX_ZONES_LOW_BATTERY + 1):
-        entities.append(AMTZoneLowBatterySensor(coordinator, entry, zone_num))
-
-    # Partition sensors
-    for partition_idx in range(MAX_PARTITIONS):
-        partition_name = PARTITION_NAMES[partition_idx]
-        entities.append(AMTPartitionSensor(coordinator, entry, partition_name))
-
-    # Status sensors
-    entities.append(AMTACPowerSensor(coordinator, entry))
-    entities.append(AMTBatteryConnectedSensor(coordinator, entry))
-    entities.append(AMTSirenSensor(coordinator, entry))
-    entities.append(AMTProblemSensor(coordinator, entry))
-
-    # Detailed problem sensors
-    entities.append(AMTBatteryLowSensor(coordinator, entry))
-    entities.append(AMTBatteryAbsentSensor(coordinator, entry))
-    entities.append(AMTBatteryShortSensor(coordinator, entry))
-    entities.append(AMTAuxOverloadSensor(coordinator, entry))
-    entities.append(AMTSirenWireCutSensor(coordinator, entry))
-    entities.append(AMTSirenShortSensor(coordinator, entry))
-    entities.append(AMTPhoneLineCutSensor(coordinator, entry))
-    entities.append(AMTCommFailureSensor(coordinator, entry))
-
-    async_add_entities(entities)
+    zone_range = range(1, MAX_ZONES_4010 + 1)
+    async_add_entities(
+        chain(
+            # Zone sensors (open, violated, bypassed)
+            (AMTZoneOpenSensor(coordinator, entry, n) for n in zone_range),
+            (AMTZoneViolatedSensor(coordinator, entry, n) for n in zone_range),
+            (AMTZoneBypassedSensor(coordinator, entry, n) for n in zone_range),
+            # Zone tamper sensors (zones 1-18)
+            (
+                AMTZoneTamperSensor(coordinator, entry, n)
+                for n in range(1, MAX_ZONES_TAMPER + 1)
+            ),
+            # Zone short-circuit sensors (zones 1-18)
+            (
+                AMTZoneShortCircuitSensor(coordinator, entry, n)
+                for n in range(1, MAX_ZONES_SHORT_CIRCUIT + 1)
+            ),
+            # Zone low battery sensors (wireless zones 1-40)
+            (
+                AMTZoneLowBatterySensor(coordinator, entry, n)
+                for n in range(1, MAX_ZONES_LOW_BATTERY + 1)
+            ),
+            # Partition sensors
+            (
+                AMTPartitionSensor(
+                    coordinator, entry, PARTITION_NAMES[idx], PARTITION_NAMES_LOWER[idx]
+                )
+                for idx in range(MAX_PARTITIONS)
+            ),
+            # Status and detailed problem sensors
+            (sensor_cls(coordinator, entry) for sensor_cls in _STATUS_SENSORS),
+        )
+    )
 
 
 class AMTBinarySensorBase(CoordinatorEntity[AMTCoordinator], BinarySensorEntity):
     """Base class for AMT binary sensors."""
 
+    __slots__ = ()
+
     _attr_has_entity_name = True
+    # Appended to the entry ID by single-instance sensors
+    _unique_id_suffix: str | None = None
 
     def __init__(
         self,
@@ -122,34 +105,27 @@ class AMTBinarySensorBase(CoordinatorEntity[AMTCoordinator], BinarySensorEntity)
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
-        self._entry = entry
+        if self._unique_id_suffix is not None:
+            self._attr_unique_id = entry.entry_id + self._unique_id_suffix
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
-        )
+        return self.coordinator.device_info
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
 
+class AMTZoneStateSensor(AMTBinarySensorBase):
+    """Base class for the zone open/violated/bypassed sensors.
 
-class AMTZoneOpenSensor(AMTBinarySensorBase):
-    """Zone open sensor."""
+    Subclasses only set class attributes: the coordinator bitmap to read and
+    the unique_id suffix/name tables from const.py.
+    """
 
-    _attr_device_class = BinarySensorDeviceClass.DOOR
+    __slots__ = ("_zone_num", "_zone_idx")
+
+    _bits_attr: str
+    _id_suffixes: tuple[str, ...]
+    _names: tuple[str, ...]
 
     def __init__(
         self,
@@ -160,86 +136,58 @@ class AMTZoneOpenSensor(AMTBinarySensorBase):
         """Initialize the zone sensor."""
         super().__init__(coordinator, entry)
         self._zone_num = zone_num
-        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_open"
-        self._attr_name = f"Zona {zone_num}"
+        self._zone_idx = zone_num - 1
+        self._attr_unique_id = entry.entry_id + self._id_suffixes[self._zone_idx]
+        self._attr_name = self._names[self._zone_idx]
 
     @property
     def is_on(self) -> bool | None:
-        """Return True if zone is open."""
-        if not self.coordinator.data:
+        """Return True if the zone bit is set."""
+        if self._zone_idx >= self.coordinator.zones_count:
+            # Zone not present on this panel model
             return None
-
-        zones_open = self.coordinator.data.get(DATA_ZONES_OPEN, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_open):
-            return zones_open[zone_idx]
-        return None
+        return bool(getattr(self.coordinator, self._bits_attr) >> self._zone_idx & 1)
 
 
-class AMTZoneViolatedSensor(AMTBinarySensorBase):
-    """Zone violated sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.MOTION
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
+class AMTZoneOpenSensor(AMTZoneStateSensor):
+    """Zone open sensor."""
 
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-        zone_num: int,
-    ) -> None:
-        """Initialize the zone violated sensor."""
-        super().__init__(coordinator, entry)
-        self._zone_num = zone_num
-        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_violated"
-        self._attr_name = f"Zona {zone_num} Violada"
+    __slots__ = ()
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if zone is violated."""
-        if not self.coordinator.data:
-            return None
+    _attr_device_class = BinarySensorDeviceClass.DOOR
+    _bits_attr = "zones_open_bits"
+    _id_suffixes = ZONE_OPEN_ID_SUFFIXES
+    _names = ZONE_OPEN_NAMES
 
-        zones_violated = self.coordinator.data.get(DATA_ZONES_VIOLATED, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_violated):
-            return zones_violated[zone_idx]
-        return None
 
+class AMTZoneViolatedSensor(AMTZoneStateSensor):
+    """Zone violated sensor."""
 
-class AMTZoneBypassedSensor(AMTBinarySensorBase):
-    """Zone bypassed sensor."""
+    __slots__ = ()
 
+    _attr_device_class = BinarySensorDeviceClass.MOTION
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _bits_attr = "zones_violated_bits"
+    _id_suffixes = ZONE_VIOLATED_ID_SUFFIXES
+    _names = ZONE_VIOLATED_NAMES
 
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-        zone_num: int,
-    ) -> None:
-        """Initialize the zone bypassed sensor."""
-        super().__init__(coordinator, entry)
-        self._zone_num = zone_num
-        self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_bypassed"
-        self._attr_name = f"Zona {zone_num} Anulada"
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if zone is bypassed."""
-        if not self.coordinator.data:
-            return None
+class AMTZoneBypassedSensor(AMTZoneStateSensor):
+    """Zone bypassed sensor."""
 
-        zones_bypassed = self.coordinator.data.get(DATA_ZONES_BYPASSED, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_bypassed):
-            return zones_bypassed[zone_idx]
-        return None
+    __slots__ = ()
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _bits_attr = "zones_bypassed_bits"
+    _id_suffixes = ZONE_BYPASSED_ID_SUFFIXES
+    _names = ZONE_BYPASSED_NAMES
 
 
 class AMTPartitionSensor(AMTBinarySensorBase):
     """Partition armed sensor."""
 
+    __slots__ = ("_partition_name", "_cached_src", "_cached_attrs")
+
     _attr_device_class = BinarySensorDeviceClass.LOCK
 
     def __init__(
@@ -247,40 +195,38 @@ class AMTPartitionSensor(AMTBinarySensorBase):
         coordinator: AMTCoordinator,
         entry: ConfigEntry,
         partition_name: str,
+        partition_id: str,
     ) -> None:
         """Initialize the partition sensor."""
         super().__init__(coordinator, entry)
         self._partition_name = partition_name
-        self._attr_unique_id = f"{entry.entry_id}_partition_{partition_name.lower()}"
+        self._cached_src: tuple[bool, bool] | None = None
+        self._cached_attrs: dict[str, Any] = {}
+        self._attr_unique_id = f"{entry.entry_id}_partition_{partition_id}"
         self._attr_name = f"Partição {partition_name}"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if partition is armed."""
-        if not self.coordinator.data:
-            return None
-
-        partitions = self.coordinator.data.get(DATA_PARTITIONS, {})
-        partition_data = partitions.get(self._partition_name, {})
+        partition_data = self.coordinator.partitions.get(self._partition_name, {})
         return partition_data.get("armed", False)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        partitions = self.coordinator.data.get(DATA_PARTITIONS, {})
-        partition_data = partitions.get(self._partition_name, {})
-        return {
-            "stay": partition_data.get("stay", False),
-            "triggered": partition_data.get("triggered", False),
-        }
+        partition_data = self.coordinator.partitions.get(self._partition_name, {})
+        src = (partition_data.get("stay", False), partition_data.get("triggered", False))
+        if src != self._cached_src:
+            self._cached_src = src
+            self._cached_attrs = {"stay": src[0], "triggered": src[1]}
+        return self._cached_attrs
 
 
 class AMTZoneTamperSensor(AMTBinarySensorBase):
     """Zone tamper sensor."""
 
+    __slots__ = ("_zone_num", "_zone_idx")
+
     _attr_device_class = BinarySensorDeviceClass.TAMPER
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -293,25 +239,21 @@ class AMTZoneTamperSensor(AMTBinarySensorBase):
         """Initialize the zone tamper sensor."""
         super().__init__(coordinator, entry)
         self._zone_num = zone_num
+        self._zone_idx = zone_num - 1
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_tamper"
         self._attr_name = f"Zona {zone_num} Tamper"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if zone has tamper."""
-        if not self.coordinator.data:
-            return None
-
-        zones_tamper = self.coordinator.data.get(DATA_ZONES_TAMPER, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_tamper):
-            return zones_tamper[zone_idx]
-        return None
+        return bool(self.coordinator.zones_tamper[self._zone_idx])
 
 
 class AMTZoneShortCircuitSensor(AMTBinarySensorBase):
     """Zone short-circuit sensor."""
 
+    __slots__ = ("_zone_num", "_zone_idx")
+
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -324,25 +266,21 @@ class AMTZoneShortCircuitSensor(AMTBinarySensorBase):
         """Initialize the zone short-circuit sensor."""
         super().__init__(coordinator, entry)
         self._zone_num = zone_num
+        self._zone_idx = zone_num - 1
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_short_circuit"
         self._attr_name = f"Zona {zone_num} Curto-Circuito"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if zone has short-circuit."""
-        if not self.coordinator.data:
-            return None
-
-        zones_short = self.coordinator.data.get(DATA_ZONES_SHORT_CIRCUIT, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_short):
-            return zones_short[zone_idx]
-        return None
+        return bool(self.coordinator.zones_short_circuit[self._zone_idx])
 
 
 class AMTZoneLowBatterySensor(AMTBinarySensorBase):
     """Wireless zone low battery sensor."""
 
+    __slots__ = ("_zone_num", "_zone_idx")
+
     _attr_device_class = BinarySensorDeviceClass.BATTERY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -355,20 +293,14 @@ class AMTZoneLowBatterySensor(AMTBinarySensorBase):
         """Initialize the zone low battery sensor."""
         super().__init__(coordinator, entry)
         self._zone_num = zone_num
+        self._zone_idx = zone_num - 1
         self._attr_unique_id = f"{entry.entry_id}_zone_{zone_num}_low_battery"
         self._attr_name = f"Zona {zone_num} Bateria Fraca"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if wireless zone has low battery."""
-        if not self.coordinator.data:
-            return None
-
-        zones_low_batt = self.coordinator.data.get(DATA_ZONES_LOW_BATTERY, [])
-        zone_idx = self._zone_num - 1
-        if zone_idx < len(zones_low_batt):
-            return zones_low_batt[zone_idx]
-        return None
+        return bool(self.coordinator.zones_low_battery[self._zone_idx])
 
 
 class AMTACPowerSensor(AMTBinarySensorBase):
@@ -377,22 +309,12 @@ class AMTACPowerSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PLUG
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Energia AC"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the AC power sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_ac_power"
+    _unique_id_suffix = "_ac_power"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if AC power is connected."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_AC_POWER, False)
+        return self.coordinator.ac_power
 
 
 class AMTBatteryConnectedSensor(AMTBinarySensorBase):
@@ -401,22 +323,12 @@ class AMTBatteryConnectedSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.BATTERY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Bateria Conectada"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the battery connected sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_battery_connected"
+    _unique_id_suffix = "_battery_connected"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if battery is connected."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_BATTERY_CONNECTED, False)
+        return self.coordinator.battery_connected
 
 
 class AMTSirenSensor(AMTBinarySensorBase):
@@ -424,22 +336,12 @@ class AMTSirenSensor(AMTBinarySensorBase):
 
     _attr_device_class = BinarySensorDeviceClass.SOUND
     _attr_name = "Sirene"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the siren sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_siren"
+    _unique_id_suffix = "_siren"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if siren is active."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_SIREN, False)
+        return self.coordinator.siren
 
 
 class AMTProblemSensor(AMTBinarySensorBase):
@@ -448,22 +350,12 @@ class AMTProblemSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Problema"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the problem sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_problem"
+    _unique_id_suffix = "_problem"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if there is a problem."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_PROBLEM, False)
+        return self.coordinator.problem
 
 
 class AMTBatteryLowSensor(AMTBinarySensorBase):
@@ -472,22 +364,15 @@ class AMTBatteryLowSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.BATTERY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Bateria Fraca"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the battery low sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_battery_low"
+    _unique_id_suffix = "_battery_low"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if battery is low."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_BATTERY_LOW, False)
+        return data.get(DATA_BATTERY_LOW, False)
 
 
 class AMTBatteryAbsentSensor(AMTBinarySensorBase):
@@ -496,22 +381,15 @@ class AMTBatteryAbsentSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Bateria Ausente"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the battery absent sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_battery_absent"
+    _unique_id_suffix = "_battery_absent"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if battery is absent."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_BATTERY_ABSENT, False)
+        return data.get(DATA_BATTERY_ABSENT, False)
 
 
 class AMTBatteryShortSensor(AMTBinarySensorBase):
@@ -520,22 +398,15 @@ class AMTBatteryShortSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Bateria em Curto"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the battery short sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_battery_short"
+    _unique_id_suffix = "_battery_short"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if battery has short-circuit."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_BATTERY_SHORT, False)
+        return data.get(DATA_BATTERY_SHORT, False)
 
 
 class AMTAuxOverloadSensor(AMTBinarySensorBase):
@@ -544,22 +415,15 @@ class AMTAuxOverloadSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Sobrecarga Aux"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the aux overload sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_aux_overload"
+    _unique_id_suffix = "_aux_overload"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if aux output is overloaded."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_AUX_OVERLOAD, False)
+        return data.get(DATA_AUX_OVERLOAD, False)
 
 
 class AMTSirenWireCutSensor(AMTBinarySensorBase):
@@ -568,22 +432,15 @@ class AMTSirenWireCutSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Fio Sirene Cortado"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the siren wire cut sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_siren_wire_cut"
+    _unique_id_suffix = "_siren_wire_cut"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if siren wire is cut."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_SIREN_WIRE_CUT, False)
+        return data.get(DATA_SIREN_WIRE_CUT, False)
 
 
 class AMTSirenShortSensor(AMTBinarySensorBase):
@@ -592,22 +449,15 @@ class AMTSirenShortSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Sirene em Curto"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the siren short sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_siren_short"
+    _unique_id_suffix = "_siren_short"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if siren has short-circuit."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_SIREN_SHORT, False)
+        return data.get(DATA_SIREN_SHORT, False)
 
 
 class AMTPhoneLineCutSensor(AMTBinarySensorBase):
@@ -616,22 +466,15 @@ class AMTPhoneLineCutSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Linha Telefonica Cortada"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the phone line cut sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_phone_line_cut"
+    _unique_id_suffix = "_phone_line_cut"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if phone line is cut."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_PHONE_LINE_CUT, False)
+        return data.get(DATA_PHONE_LINE_CUT, False)
 
 
 class AMTCommFailureSensor(AMTBinarySensorBase):
@@ -640,19 +483,28 @@ class AMTCommFailureSensor(AMTBinarySensorBase):
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Falha de Comunicacao"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the communication failure sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_comm_failure"
+    _unique_id_suffix = "_comm_failure"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if there is a communication failure."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_COMM_FAILURE, False)
+        return data.get(DATA_COMM_FAILURE, False)
+
+
+_STATUS_SENSORS: tuple[type[AMTBinarySensorBase], ...] = (
+    AMTACPowerSensor,
+    AMTBatteryConnectedSensor,
+    AMTSirenSensor,
+    AMTProblemSensor,
+    AMTBatteryLowSensor,
+    AMTBatteryAbsentSensor,
+    AMTBatteryShortSensor,
+    AMTAuxOverloadSensor,
+    AMTSirenWireCutSensor,
+    AMTSirenShortSensor,
+    AMTPhoneLineCutSensor,
+    AMTCommFailureSensor,
+)
@@ -6,18 +6,12 @@ import logging
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    DATA_CONNECTED,
-    DATA_MODEL_NAME,
-    DOMAIN,
-    ENTITY_PREFIX,
-)
+from .const import DOMAIN
 from .coordinator import AMTCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,21 +25,24 @@ async def async_setup_entry(
     """Set up buttons from a config entry."""
     coordinator: AMTCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    entities: list[ButtonEntity] = []
-
-    # Stay mode button
-    entities.append(AMTStayButton(coordinator, entry))
-
-    # Bypass open zones button
-    entities.append(AMTBypassOpenZonesButton(coordinator, entry))
-
-    async_add_entities(entities)
+    async_add_entities(
+        (
+            # Stay mode button
+            AMTStayButton(coordinator, entry),
+            # Bypass open zones button
+            AMTBypassOpenZonesButton(coordinator, entry),
+        )
+    )
 
 
 class AMTButtonBase(CoordinatorEntity[AMTCoordinator], ButtonEntity):
     """Base class for AMT buttons."""
 
+    __slots__ = ("_last_available",)
+
     _attr_has_entity_name = True
+    # Appended to the entry ID to build the unique ID
+    _unique_id_suffix: str
 
     def __init__(
         self,
@@ -54,28 +51,24 @@ class AMTButtonBase(CoordinatorEntity[AMTCoordinator], ButtonEntity):
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
-        self._entry = entry
+        self._last_available: bool | None = None
+        self._attr_unique_id = entry.entry_id + self._unique_id_suffix
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
-        )
+        return self.coordinator.device_info
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability changes.
+
+        Button state (last press) does not depend on coordinator data.
+        """
+        available = self.available
+        if available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
 
 
 class AMTStayButton(AMTButtonBase):
@@ -83,15 +76,7 @@ class AMTStayButton(AMTButtonBase):
 
     _attr_name = "Armar Stay"
     _attr_icon = "mdi:shield-home"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the stay button."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_stay"
+    _unique_id_suffix = "_stay"
 
     async def async_press(self) -> None:
         """Handle button press."""
@@ -103,15 +88,7 @@ class AMTBypassOpenZonesButton(AMTButtonBase):
 
     _attr_name = "Anular Zonas Abertas"
     _attr_icon = "mdi:shield-link-variant"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the bypass button."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_bypass_open_zones"
+    _unique_id_suffix = "_bypass_open_zones"
 
     async def async_press(self) -> None:
         """Handle button press."""
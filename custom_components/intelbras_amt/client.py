@@ -3,21 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache, reduce
+from itertools import chain
 import logging
-from typing import Any
+from operator import xor
+import socket
+import struct
+from typing import Any, Sequence
 
 from .const import (
+    ARM_PARTITION_CMDS,
     CMD_ARM,
-    CMD_ARM_PARTITION_A,
-    CMD_ARM_PARTITION_B,
-    CMD_ARM_PARTITION_C,
-    CMD_ARM_PARTITION_D,
     CMD_BYPASS,
     CMD_DISARM,
-    CMD_DISARM_PARTITION_A,
-    CMD_DISARM_PARTITION_B,
-    CMD_DISARM_PARTITION_C,
-    CMD_DISARM_PARTITION_D,
     CMD_PGM_OFF_PREFIX,
     CMD_PGM_ON_PREFIX,
     CMD_SIREN_OFF,
@@ -58,8 +56,12 @@ from .const import (
     DATA_ZONES_TAMPER,
     DATA_ZONES_VIOLATED,
     DATA_ZONES_VIOLATED_COUNT,
+    DISARM_PARTITION_CMDS,
     FRAME_SEPARATOR,
     FRAME_START,
+    KEEPALIVE_COUNT,
+    KEEPALIVE_IDLE,
+    KEEPALIVE_INTERVAL,
     MAX_PGMS,
     MAX_ZONES_2018,
     MAX_ZONES_4010,
@@ -70,22 +72,91 @@ from .const import (
     MODEL_AMT_4010_SMART,
     MODEL_NAMES,
     NACK_MESSAGES,
-    OFFSET_BATTERY_LEVEL,
-    OFFSET_CENTRAL_STATUS,
-    OFFSET_FIRMWARE,
-    OFFSET_MODEL_ID,
-    OFFSET_PARTITION_AB,
-    OFFSET_PARTITION_CD,
-    OFFSET_PGM_SIREN_STATUS,
-    OFFSET_POWER_STATUS,
-    OFFSET_ZONES_BYPASSED_START,
-    OFFSET_ZONES_OPEN_START,
-    OFFSET_ZONES_VIOLATED_START,
+    STATUS_COALESCE_WINDOW,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _password_to_bytes(password: str) -> bytes:
+    """Convert password string to protocol bytes.
+
+    Pairs of digits are packed into single bytes, e.g. "123456" ->
+    [0x12, 0x34, 0x56], padded with F. Raises ValueError on non-hex input.
+    """
+    return bytes.fromhex(password.ljust(6, "F")[:6])
+
+
+def _partition_index(partition: str) -> int:
+    """Return the index (A=0 .. D=3) of a partition letter."""
+    idx = "ABCD".find(partition)
+    if idx < 0 or len(partition) != 1:
+        raise ValueError(f"Invalid partition: {partition}")
+    return idx
+
+
+# Bit states of every byte value, LSB first (zone 1 = bit 0)
+_BYTE_BITS = tuple(tuple(bool(b >> bit & 1) for bit in range(8)) for b in range(256))
+
+# Fixed layout of the status response up to byte 46 (see OFFSET_* in const):
+# 0-1 header, 2-25 zones open/violated/bypassed (8 bytes each), 26 model,
+# 27 firmware, 28-29 partitions AB/CD, 30 central status, 36 power,
+# 37 problems, 41 battery level, 46 PGM/siren
+_STATUS_STRUCT = struct.Struct("<2x8s8s8s5B5x2B3xB4xB")
+
+# Status byte decoders, indexed by the raw byte (or nibble for partitions).
+# Partition dicts are shared between parses and must be treated as read-only.
+_PARTITION_STATUS = tuple(
+    {"armed": bool(b & 0x01), "stay": bool(b & 0x02), "triggered": bool(b & 0x04)}
+    for b in range(16)
+)
+# (armed, stay, triggered)
+_CENTRAL_STATUS = tuple(
+    (bool(b & 0x08), bool(b & 0x10), bool(b & 0x04)) for b in range(256)
+)
+# (ac_power, battery_connected, battery_low, battery_short, aux_overload)
+_POWER_STATUS = tuple(
+    (bool(b & 0x01), bool(b & 0x04), bool(b & 0x02), bool(b & 0x08), bool(b & 0x10))
+    for b in range(256)
+)
+
+
+def _zones_to_list(mask: int, max_zones: int) -> list[bool]:
+    """Expand a zone bitmask into the list of booleans published as status."""
+    return list(
+        chain.from_iterable(map(_BYTE_BITS.__getitem__, mask.to_bytes(8, "little")))
+    )[:max_zones]
+
+
+def _calculate_checksum(data: bytes) -> int:
+    """Calculate XOR checksum for the frame."""
+    # reduce() with the C-level operator.xor runs without a Python frame
+    # per byte and beats word folding at the frame sizes used here
+    return reduce(xor, data, 0)
+
+
+@lru_cache(maxsize=32)
+def _encode_frame(password: str, command: bytes) -> bytes:
+    """Build a complete protocol frame, checksum included.
+
+    Passwords and commands are fixed per client, so after the first send of
+    each command the whole frame comes straight from the cache.
+    """
+    # Frame: [Length] [0xe9] [0x21] [PASSWORD_BYTES] [COMMAND] [0x21] [XOR_CHECKSUM]
+    # Length = everything except length byte and checksum
+    pwd_bytes = _password_to_bytes(password)
+    cmd_start = 3 + len(pwd_bytes)
+    frame = bytearray(cmd_start + len(command) + 2)
+    frame[0] = len(frame) - 1
+    frame[1] = FRAME_START
+    frame[2] = FRAME_SEPARATOR
+    frame[3:cmd_start] = pwd_bytes
+    frame[cmd_start : cmd_start + len(command)] = command
+    frame[-2] = FRAME_SEPARATOR
+    frame[-1] = _calculate_checksum(frame[:-1])
+    return bytes(frame)
+
+
 class AMTClientError(Exception):
     """Base exception for AMT client errors."""
 
@@ -111,6 +182,21 @@ class AMTNackError(AMTClientError):
 class AMTClient:
     """AMT TCP protocol client."""
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_password",
+        "_reader",
+        "_writer",
+        "_lock",
+        "_connected",
+        "_partition_passwords",
+        "_last_raw",
+        "_last_parsed",
+        "_status_task",
+        "_last_status_time",
+    )
+
     def __init__(self, host: str, port: int, password: str) -> None:
         """Initialize the AMT client."""
         self._host = host
@@ -121,6 +207,12 @@ class AMTClient:
         self._lock = asyncio.Lock()
         self._connected = False
         self._partition_passwords: dict[str, str] = {}
+        # Last status response and its parsed form, reused while unchanged
+        self._last_raw: bytes | None = None
+        self._last_parsed: dict[str, Any] | None = None
+        # In-flight status request shared by concurrent callers
+        self._status_task: asyncio.Task[dict[str, Any]] | None = None
+        self._last_status_time = 0.0
 
     def set_partition_passwords(
         self,
@@ -154,6 +246,7 @@ class AMTClient:
                 asyncio.open_connection(self._host, self._port),
                 timeout=CONNECTION_TIMEOUT,
             )
+            self._configure_socket()
             self._connected = True
             _LOGGER.info("Connected to AMT at %s:%s", self._host, self._port)
         except asyncio.TimeoutError as err:
@@ -165,6 +258,26 @@ class AMTClient:
                 f"Connection failed to {self._host}:{self._port}: {err}"
             ) from err
 
+    def _configure_socket(self) -> None:
+        """Tune the panel socket for small request/response frames.
+
+        TCP_NODELAY sends each short frame immediately instead of waiting on
+        Nagle's algorithm; keepalive detects idle drops without reconnecting.
+        """
+        sock = self._writer.get_extra_info("socket") if self._writer else None
+        if sock is None:
+            return
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Per-connection keepalive timing is not available on every platform
+        for option, value in (
+            ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+            ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+            ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+        ):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
     async def disconnect(self) -> None:
         """Disconnect from the AMT alarm panel."""
         if self._writer:
@@ -178,39 +291,9 @@ class AMTClient:
         self._connected = False
         _LOGGER.info("Disconnected from AMT")
 
-    def _calculate_checksum(self, data: bytes) -> int:
-        """Calculate XOR checksum for the frame."""
-        checksum = 0
-        for byte in data:
-            checksum ^= byte
-        return checksum
-
-    def _password_to_bytes(self, password: str) -> bytes:
-        """Convert password string to protocol bytes."""
-        # Password is encoded as pairs of digits combined into single bytes
-        # e.g., "123456" -> [0x12, 0x34, 0x56]
-        password = password.ljust(6, "F")[:6]  # Pad with F, truncate to 6
-        result = []
-        for i in range(0, len(password), 2):
-            pair = password[i : i + 2]
-            # Convert each char: digit -> value, F -> 0x0F
-            high = int(pair[0], 16) if pair[0].upper() in "0123456789ABCDEF" else 0
-            low = int(pair[1], 16) if pair[1].upper() in "0123456789ABCDEF" else 0
-            result.append((high << 4) | low)
-        return bytes(result)
-
     def _build_frame(self, command: bytes, password: str | None = None) -> bytes:
         """Build a protocol frame with checksum."""
-        pwd = password or self._password
-        pwd_bytes = self._password_to_bytes(pwd)
-
-        # Frame: [Length] [0xe9] [0x21] [PASSWORD_BYTES] [COMMAND] [0x21] [XOR_CHECKSUM]
-        # Length = everything except length byte and checksum
-        inner = bytes([FRAME_START, FRAME_SEPARATOR]) + pwd_bytes + command + bytes([FRAME_SEPARATOR])
-        length = len(inner) + 1  # +1 for checksum
-        frame_without_checksum = bytes([length]) + inner
-        checksum = self._calculate_checksum(frame_without_checksum)
-        return frame_without_checksum + bytes([checksum])
+        return _encode_frame(password or self._password, command)
 
     async def _send_command(self, command: bytes, password: str | None = None) -> bytes:
         """Send a command and receive the response."""
@@ -221,28 +304,41 @@ class AMTClient:
             if not self._writer or not self._reader:
                 raise AMTConnectionError("Not connected")
 
+            if command != CMD_STATUS:
+                # The panel state may change; don't serve a coalesced status
+                self._last_status_time = 0.0
+
             frame = self._build_frame(command, password)
-            _LOGGER.debug("Sending frame: %s", frame.hex())
+            # Skip hex formatting on every poll unless debug logging is on
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            if debug:
+                _LOGGER.debug("Sending frame: %s", frame.hex())
 
             try:
                 self._writer.write(frame)
                 await self._writer.drain()
 
-                # Read response - first byte is length
-                header = await asyncio.wait_for(
-                    self._reader.read(1),
-                    timeout=CONNECTION_TIMEOUT,
-                )
-                if not header:
-                    self._connected = False
-                    raise AMTConnectionError("Connection closed by remote")
-
+                # Read response - first byte is length. A slow panel gets one
+                # more wait on the same socket before the connection is dropped;
+                # no byte has been consumed yet, so the stream stays in sync.
+                try:
+                    header = await asyncio.wait_for(
+                        self._reader.readexactly(1),
+                        timeout=CONNECTION_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    _LOGGER.debug("No response yet, waiting once more")
+                    header = await asyncio.wait_for(
+                        self._reader.readexactly(1),
+                        timeout=CONNECTION_TIMEOUT,
+                    )
                 length = header[0]
                 response = await asyncio.wait_for(
-                    self._reader.read(length),
+                    self._reader.readexactly(length),
                     timeout=CONNECTION_TIMEOUT,
                 )
-                _LOGGER.debug("Received response: %s", response.hex())
+                if debug:
+                    _LOGGER.debug("Received response: %s", response.hex())
 
                 # Check for NACK response (error code in the response)
                 if len(response) >= 3 and response[0] == FRAME_START:
@@ -253,6 +349,9 @@ class AMTClient:
 
                 return response
 
+            except asyncio.IncompleteReadError as err:
+                self._connected = False
+                raise AMTConnectionError("Connection closed by remote") from err
             except asyncio.TimeoutError as err:
                 self._connected = False
                 raise AMTConnectionError("Response timeout") from err
@@ -260,35 +359,32 @@ class AMTClient:
                 self._connected = False
                 raise AMTConnectionError(f"Communication error: {err}") from err
 
-    def _parse_zones(self, data: bytes, offset: int, max_zones: int) -> list[bool]:
-        """Parse zone status bytes into a list of booleans."""
-        zones = []
-        for byte_idx in range(8):  # 8 bytes = 64 zones max
-            if offset + byte_idx >= len(data):
-                break
-            byte = data[offset + byte_idx]
-            for bit in range(8):
-                zone_num = byte_idx * 8 + bit
-                if zone_num >= max_zones:
-                    break
-                zones.append(bool(byte & (1 << bit)))
-        return zones[:max_zones]
-
-    def _parse_partition_status(self, status_byte: int) -> dict[str, bool]:
-        """Parse partition status byte."""
-        return {
-            "armed": bool(status_byte & 0x01),
-            "stay": bool(status_byte & 0x02),
-            "triggered": bool(status_byte & 0x04),
-        }
+    def _parse_zones(self, zone_bytes: bytes, max_zones: int) -> int:
+        """Parse zone status bytes into a bitmask (bit N = zone N+1)."""
+        # 8 bytes = 64 zones max
+        return int.from_bytes(zone_bytes, "little") & ((1 << max_zones) - 1)
 
     def _parse_response(self, data: bytes) -> dict[str, Any]:
         """Parse status response into structured data."""
-        if len(data) < 47:
+        if len(data) < _STATUS_STRUCT.size:
             raise AMTProtocolError(f"Response too short: {len(data)} bytes")
 
+        (
+            open_bytes,
+            violated_bytes,
+            bypassed_bytes,
+            model_id,
+            firmware_byte,
+            part_ab,
+            part_cd,
+            central_status,
+            power_status,
+            problem_byte,
+            battery_level,
+            pgm_siren,
+        ) = _STATUS_STRUCT.unpack_from(data)
+
         # Determine model and max zones
-        model_id = data[OFFSET_MODEL_ID] if len(data) > OFFSET_MODEL_ID else 0
         model_name = MODEL_NAMES.get(model_id, f"Unknown (0x{model_id:02x})")
 
         if model_id == MODEL_AMT_4010_SMART:
@@ -299,91 +395,70 @@ class AMTClient:
             max_zones = MAX_ZONES_4010  # Default to max
 
         # Parse firmware version
-        firmware_byte = data[OFFSET_FIRMWARE] if len(data) > OFFSET_FIRMWARE else 0
         firmware_major = (firmware_byte >> 4) & 0x0F
         firmware_minor = firmware_byte & 0x0F
         firmware = f"{firmware_major}.{firmware_minor}"
 
         # Parse partition status
-        part_ab = data[OFFSET_PARTITION_AB] if len(data) > OFFSET_PARTITION_AB else 0
-        part_cd = data[OFFSET_PARTITION_CD] if len(data) > OFFSET_PARTITION_CD else 0
-
         partitions = {
-            "A": self._parse_partition_status(part_ab & 0x0F),
-            "B": self._parse_partition_status((part_ab >> 4) & 0x0F),
-            "C": self._parse_partition_status(part_cd & 0x0F),
-            "D": self._parse_partition_status((part_cd >> 4) & 0x0F),
+            "A": _PARTITION_STATUS[part_ab & 0x0F],
+            "B": _PARTITION_STATUS[part_ab >> 4],
+            "C": _PARTITION_STATUS[part_cd & 0x0F],
+            "D": _PARTITION_STATUS[part_cd >> 4],
         }
 
         # Parse central status
-        central_status = data[OFFSET_CENTRAL_STATUS] if len(data) > OFFSET_CENTRAL_STATUS else 0
-        armed = bool(central_status & 0x08)
-        stay = bool(central_status & 0x10)
-        triggered = bool(central_status & 0x04)
+        armed, stay, triggered = _CENTRAL_STATUS[central_status]
 
         # Parse power status
-        power_status = data[OFFSET_POWER_STATUS] if len(data) > OFFSET_POWER_STATUS else 0
-        ac_power = bool(power_status & 0x01)
-        battery_connected = bool(power_status & 0x04)
-
-        # Parse battery level (0-100)
-        battery_level = data[OFFSET_BATTERY_LEVEL] if len(data) > OFFSET_BATTERY_LEVEL else 0
-        battery_level = min(100, max(0, battery_level))
+        (
+            ac_power,
+            battery_connected,
+            battery_low,
+            battery_short,
+            aux_overload,
+        ) = _POWER_STATUS[power_status]
+
+        # Parse battery level (0-100); a byte is never negative
+        if battery_level > 100:
+            battery_level = 100
 
         # Parse PGM/Siren status
-        pgm_siren = data[OFFSET_PGM_SIREN_STATUS] if len(data) > OFFSET_PGM_SIREN_STATUS else 0
-        siren = bool(pgm_siren & 0x01)
+        siren = _BYTE_BITS[pgm_siren][0]
 
         # Parse PGMs 1-19 (expanded from 3)
-        # First 3 PGMs are in the pgm_siren byte, the rest may be in additional bytes
+        # First 3 PGMs are bits 1-3 of the pgm_siren byte, the rest may be in
+        # additional bytes
         pgms = [False] * MAX_PGMS
-        pgms[0] = bool(pgm_siren & 0x02)  # PGM 1
-        pgms[1] = bool(pgm_siren & 0x04)  # PGM 2
-        pgms[2] = bool(pgm_siren & 0x08)  # PGM 3
+        pgms[0:3] = _BYTE_BITS[pgm_siren][1:4]
 
-        # Parse additional PGM bytes if available (bytes 47-49 for PGMs 4-19)
+        # Parse additional PGM bytes if available (bytes 47-48 for PGMs 4-19)
         if len(data) > 47:
-            pgm_byte1 = data[47]
-            for i in range(8):
-                if 3 + i < MAX_PGMS:
-                    pgms[3 + i] = bool(pgm_byte1 & (1 << i))
+            pgms[3:11] = _BYTE_BITS[data[47]]
         if len(data) > 48:
-            pgm_byte2 = data[48]
-            for i in range(8):
-                if 11 + i < MAX_PGMS:
-                    pgms[11 + i] = bool(pgm_byte2 & (1 << i))
+            pgms[11:19] = _BYTE_BITS[data[48]]
 
         # Parse problem status - general problem flag
         problem = bool(central_status & 0x10)
 
         # Parse detailed problem status from power_status and additional bytes
         # These are based on typical AMT protocol definitions
-        battery_low = bool(power_status & 0x02)
         battery_absent = not battery_connected
-        battery_short = bool(power_status & 0x08)
-        aux_overload = bool(power_status & 0x10)
-
-        # Siren and communication problems (may be in additional bytes)
-        siren_wire_cut = False
-        siren_short = False
-        phone_line_cut = False
-        comm_failure = False
-        if len(data) > 37:
-            problem_byte = data[37]
-            siren_wire_cut = bool(problem_byte & 0x01)
-            siren_short = bool(problem_byte & 0x02)
-            phone_line_cut = bool(problem_byte & 0x04)
-            comm_failure = bool(problem_byte & 0x08)
-
-        # Parse zone lists
-        zones_open = self._parse_zones(data, OFFSET_ZONES_OPEN_START, max_zones)
-        zones_violated = self._parse_zones(data, OFFSET_ZONES_VIOLATED_START, max_zones)
-        zones_bypassed = self._parse_zones(data, OFFSET_ZONES_BYPASSED_START, max_zones)
+
+        # Siren and communication problems
+        siren_wire_cut, siren_short, phone_line_cut, comm_failure = _BYTE_BITS[
+            problem_byte
+        ][:4]
+
+        # Parse zone bitmasks (bit N = zone N+1)
+        zones_open = self._parse_zones(open_bytes, max_zones)
+        zones_violated = self._parse_zones(violated_bytes, max_zones)
+        zones_bypassed = self._parse_zones(bypassed_bytes, max_zones)
 
         # Calculate zone counts
-        zones_open_count = sum(zones_open)
-        zones_violated_count = sum(zones_violated)
-        zones_bypassed_count = sum(zones_bypassed)
+        zones_open_count = zones_open.bit_count()
+        zones_violated_count = zones_violated.bit_count()
+        zones_bypassed_count = zones_bypassed.bit_count()
 
         # Initialize empty arrays for tamper, short-circuit, and low-battery zones
         # These would be populated from extended status commands if available
@@ -397,9 +472,9 @@ class AMTClient:
             DATA_MODEL_NAME: model_name,
             DATA_MAX_ZONES: max_zones,
             DATA_FIRMWARE: firmware,
-            DATA_ZONES_OPEN: zones_open,
-            DATA_ZONES_VIOLATED: zones_violated,
-            DATA_ZONES_BYPASSED: zones_bypassed,
+            DATA_ZONES_OPEN: _zones_to_list(zones_open, max_zones),
+            DATA_ZONES_VIOLATED: _zones_to_list(zones_violated, max_zones),
+            DATA_ZONES_BYPASSED: _zones_to_list(zones_bypassed, max_zones),
             DATA_ZONES_TAMPER: zones_tamper,
             DATA_ZONES_SHORT_CIRCUIT: zones_short_circuit,
             DATA_ZONES_LOW_BATTERY: zones_low_battery,
@@ -428,9 +503,46 @@ class AMTClient:
         }
 
     async def get_status(self) -> dict[str, Any]:
-        """Get the current status of the alarm panel."""
+        """Get the current status of the alarm panel.
+
+        Concurrent callers share one in-flight request, and a status fetched
+        less than STATUS_COALESCE_WINDOW ago is reused. Sending any other
+        command invalidates it. The returned dict may be shared between
+        callers and must not be mutated.
+        """
+        if self._status_task is not None:
+            return await asyncio.shield(self._status_task)
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._last_parsed is not None
+            and loop.time() - self._last_status_time < STATUS_COALESCE_WINDOW
+        ):
+            return self._last_parsed
+
+        task = self._status_task = loop.create_task(self._fetch_status())
+        task.add_done_callback(self._clear_status_task)
+        return await asyncio.shield(task)
+
+    def _clear_status_task(self, task: asyncio.Task[dict[str, Any]]) -> None:
+        """Forget a finished status request."""
+        if self._status_task is task:
+            self._status_task = None
+
+    async def _fetch_status(self) -> dict[str, Any]:
+        """Request and parse the panel status.
+
+        An idle panel keeps returning the same bytes; the previously parsed
+        dict is reused in that case.
+        """
         response = await self._send_command(CMD_STATUS)
-        return self._parse_response(response)
+        self._last_status_time = asyncio.get_running_loop().time()
+        if response == self._last_raw and self._last_parsed is not None:
+            return self._last_parsed
+        parsed = self._parse_response(response)
+        self._last_raw = response
+        self._last_parsed = parsed
+        return parsed
 
     async def arm(self, password: str | None = None) -> None:
         """Arm the alarm panel."""
@@ -446,31 +558,15 @@ class AMTClient:
 
     async def arm_partition(self, partition: str, password: str | None = None) -> None:
         """Arm a specific partition."""
-        commands = {
-            "A": CMD_ARM_PARTITION_A,
-            "B": CMD_ARM_PARTITION_B,
-            "C": CMD_ARM_PARTITION_C,
-            "D": CMD_ARM_PARTITION_D,
-        }
-        if partition not in commands:
-            raise ValueError(f"Invalid partition: {partition}")
-
+        command = ARM_PARTITION_CMDS[_partition_index(partition)]
         pwd = password or self._partition_passwords.get(partition) or self._password
-        await self._send_command(commands[partition], pwd)
+        await self._send_command(command, pwd)
 
     async def disarm_partition(self, partition: str, password: str | None = None) -> None:
         """Disarm a specific partition."""
-        commands = {
-            "A": CMD_DISARM_PARTITION_A,
-            "B": CMD_DISARM_PARTITION_B,
-            "C": CMD_DISARM_PARTITION_C,
-            "D": CMD_DISARM_PARTITION_D,
-        }
-        if partition not in commands:
-            raise ValueError(f"Invalid partition: {partition}")
-
+        command = DISARM_PARTITION_CMDS[_partition_index(partition)]
         pwd = password or self._partition_passwords.get(partition) or self._password
-        await self._send_command(commands[partition], pwd)
+        await self._send_command(command, pwd)
 
     async def activate_pgm(self, pgm_number: int) -> None:
         """Activate a PGM output."""
@@ -504,21 +600,21 @@ class AMTClient:
         """Turn siren off."""
         await self._send_command(CMD_SIREN_OFF)
 
-    async def bypass_zones(self, zone_mask: list[bool]) -> None:
-        """Bypass zones specified in the mask."""
-        # Convert boolean list to bytes (8 zones per byte)
-        mask_bytes = []
-        for i in range(0, len(zone_mask), 8):
-            byte = 0
-            for bit in range(8):
-                if i + bit < len(zone_mask) and zone_mask[i + bit]:
-                    byte |= 1 << bit
-            mask_bytes.append(byte)
-
-        command = CMD_BYPASS + bytes(mask_bytes)
+    async def bypass_zones(self, zone_mask: int | Sequence[bool]) -> None:
+        """Bypass zones specified in the mask.
+
+        Accepts an int bitmask (bit N = zone N+1, sent as 8 bytes) or a
+        sequence of zone states (8 zones per byte).
+        """
+        if isinstance(zone_mask, int):
+            mask, length = zone_mask, 8
+        else:
+            mask = sum(1 << idx for idx, state in enumerate(zone_mask) if state)
+            length = (len(zone_mask) + 7) // 8
+        command = CMD_BYPASS + mask.to_bytes(length, "little")
         await self._send_command(command)
 
-    async def bypass_open_zones(self, open_zones: list[bool]) -> None:
+    async def bypass_open_zones(self, open_zones: int | Sequence[bool]) -> None:
         """Bypass all currently open zones."""
         await self.bypass_zones(open_zones)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -17,6 +18,8 @@ from .const import (
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,6 +34,22 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+@lru_cache(maxsize=16)
+def _options_schema(scan_interval: int) -> vol.Schema:
+    """Return the options schema for the given current scan interval.
+
+    Keyed on the default rather than the entry, so a changed option is
+    never served from a stale schema.
+    """
+    return vol.Schema(
+        {
+            vol.Required(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
+                vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+            ),
+        }
+    )
+
+
 class AMTConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Intelbras AMT."""
 
@@ -96,17 +115,12 @@ class AMTOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SCAN_INTERVAL,
-                        default=self._config_entry.options.get(
-                            CONF_SCAN_INTERVAL,
-                            self._config_entry.data.get(
-                                CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-                            ),
-                        ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
-                }
+            data_schema=_options_schema(
+                self._config_entry.options.get(
+                    CONF_SCAN_INTERVAL,
+                    self._config_entry.data.get(
+                        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                    ),
+                )
             ),
         )
@@ -8,7 +8,14 @@ DOMAIN: Final = "intelbras_amt"
 DEFAULT_PORT: Final = 9009
 DEFAULT_CONTROL_PORT: Final = 9019  # HTTP control port for CLI access
 DEFAULT_SCAN_INTERVAL: Final = 1  # seconds
+MIN_SCAN_INTERVAL: Final = 1  # seconds; lower values would poll in a tight loop
+MAX_SCAN_INTERVAL: Final = 60  # seconds
+REFRESH_COOLDOWN: Final = 0.3  # seconds to wait for more commands before refreshing
 CONNECTION_TIMEOUT: Final = 5  # seconds
+KEEPALIVE_IDLE: Final = 30  # seconds before the first TCP keepalive probe
+KEEPALIVE_INTERVAL: Final = 10  # seconds between keepalive probes
+KEEPALIVE_COUNT: Final = 3  # unanswered probes before the connection drops
+STATUS_COALESCE_WINDOW: Final = 0.2  # seconds a fetched status is reused
 RECONNECT_INTERVAL: Final = 10  # seconds
 
 # Configuration keys
@@ -49,6 +56,27 @@ CMD_DISARM_PARTITION_A: Final = bytes([0x44, 0x41])  # 'DA'
 CMD_DISARM_PARTITION_B: Final = bytes([0x44, 0x42])  # 'DB'
 CMD_DISARM_PARTITION_C: Final = bytes([0x44, 0x43])  # 'DC'
 CMD_DISARM_PARTITION_D: Final = bytes([0x44, 0x44])  # 'DD'
+
+# Partition commands indexed by partition (A=0 .. D=3)
+ARM_PARTITION_CMDS: Final = (
+    CMD_ARM_PARTITION_A,
+    CMD_ARM_PARTITION_B,
+    CMD_ARM_PARTITION_C,
+    CMD_ARM_PARTITION_D,
+)
+STAY_PARTITION_CMDS: Final = (
+    CMD_STAY_PARTITION_A,
+    CMD_STAY_PARTITION_B,
+    CMD_STAY_PARTITION_C,
+    CMD_STAY_PARTITION_D,
+)
+DISARM_PARTITION_CMDS: Final = (
+    CMD_DISARM_PARTITION_A,
+    CMD_DISARM_PARTITION_B,
+    CMD_DISARM_PARTITION_C,
+    CMD_DISARM_PARTITION_D,
+)
+
 CMD_PGM_ON_PREFIX: Final = bytes([0x50, 0x4C])  # 'PL'
 CMD_PGM_OFF_PREFIX: Final = bytes([0x50, 0x44])  # 'PD'
 CMD_BYPASS: Final = bytes([0x42])  # 'B'
@@ -132,6 +160,27 @@ MAX_ZONES_TAMPER: Final = 18
 MAX_ZONES_SHORT_CIRCUIT: Final = 18
 MAX_ZONES_LOW_BATTERY: Final = 40
 
+# Per-zone/PGM unique_id suffixes and display names (index = number - 1)
+ZONE_OPEN_ID_SUFFIXES: Final = tuple(f"_zone_{n}_open" for n in range(1, MAX_ZONES_4010 + 1))
+ZONE_VIOLATED_ID_SUFFIXES: Final = tuple(
+    f"_zone_{n}_violated" for n in range(1, MAX_ZONES_4010 + 1)
+)
+ZONE_BYPASSED_ID_SUFFIXES: Final = tuple(
+    f"_zone_{n}_bypassed" for n in range(1, MAX_ZONES_4010 + 1)
+)
+ZONE_OPEN_NAMES: Final = tuple(f"Zona {n}" for n in range(1, MAX_ZONES_4010 + 1))
+ZONE_VIOLATED_NAMES: Final = tuple(f"Zona {n} Violada" for n in range(1, MAX_ZONES_4010 + 1))
+ZONE_BYPASSED_NAMES: Final = tuple(f"Zona {n} Anulada" for n in range(1, MAX_ZONES_4010 + 1))
+PGM_ID_SUFFIXES: Final = tuple(f"_pgm_{n}_switch" for n in range(1, MAX_PGMS + 1))
+PGM_NAMES: Final = tuple(f"PGM {n}" for n in range(1, MAX_PGMS + 1))
+# PGM commands: prefix + PGM number as two ASCII digits ('01' to '19')
+PGM_ON_CMDS: Final = tuple(
+    CMD_PGM_ON_PREFIX + b"%02d" % n for n in range(1, MAX_PGMS + 1)
+)
+PGM_OFF_CMDS: Final = tuple(
+    CMD_PGM_OFF_PREFIX + b"%02d" % n for n in range(1, MAX_PGMS + 1)
+)
+
 # Entity prefixes
 ENTITY_PREFIX: Final = "amt"
 
@@ -173,6 +222,11 @@ DATA_ZONES_OPEN_COUNT: Final = "zones_open_count"
 DATA_ZONES_VIOLATED_COUNT: Final = "zones_violated_count"
 DATA_ZONES_BYPASSED_COUNT: Final = "zones_bypassed_count"
 
+# Zone bitmask data keys (bit N = zone N+1)
+DATA_ZONES_OPEN_MASK: Final = "zones_open_mask"
+DATA_ZONES_VIOLATED_MASK: Final = "zones_violated_mask"
+DATA_ZONES_BYPASSED_MASK: Final = "zones_bypassed_mask"
+
 # Date/time from central
 DATA_DATETIME: Final = "datetime"
 
@@ -183,3 +237,6 @@ PARTITION_NAMES: Final = {
     2: "C",
     3: "D",
 }
+PARTITION_NAMES_LOWER: Final = tuple(
+    PARTITION_NAMES[idx].lower() for idx in range(MAX_PARTITIONS)
+)
@@ -3,15 +3,30 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from aiohttp import web
 
-from .const import DEFAULT_CONTROL_PORT
+from .const import (
+    DATA_ZONES_BYPASSED,
+    DATA_ZONES_BYPASSED_MASK,
+    DATA_ZONES_OPEN,
+    DATA_ZONES_OPEN_MASK,
+    DATA_ZONES_VIOLATED,
+    DATA_ZONES_VIOLATED_MASK,
+    DEFAULT_CONTROL_PORT,
+)
 from .server import AMTServer
 
 _LOGGER = logging.getLogger(__name__)
 
+# Zone bitmask key -> key of its zone number list in /status
+_ZONE_MASK_KEYS = {
+    DATA_ZONES_OPEN_MASK: DATA_ZONES_OPEN,
+    DATA_ZONES_VIOLATED_MASK: DATA_ZONES_VIOLATED,
+    DATA_ZONES_BYPASSED_MASK: DATA_ZONES_BYPASSED,
+}
+
 
 class AMTControlServer:
     """HTTP REST API server for controlling AMT panel via CLI."""
@@ -27,6 +42,18 @@ class AMTControlServer:
         self._port = port
         self._app: web.Application | None = None
         self._runner: web.AppRunner | None = None
+        # Batch command type -> runner
+        self._batch_runners: dict[
+            str, Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+        ] = {
+            "status": self._run_status,
+            "raw": self._run_raw,
+            "arm": self._run_arm,
+            "disarm": self._run_disarm,
+            "stay": self._run_stay,
+            "siren": self._run_siren,
+            "pgm": self._run_pgm,
+        }
 
     @property
     def port(self) -> int:
@@ -63,6 +90,7 @@ class AMTControlServer:
         self._app.router.add_post("/command/stay", self._handle_stay)
         self._app.router.add_post("/command/siren", self._handle_siren)
         self._app.router.add_post("/command/pgm", self._handle_pgm)
+        self._app.router.add_post("/command/batch", self._handle_batch)
 
     async def _handle_status(self, request: web.Request) -> web.Response:
         """GET /status - Get current panel status."""
@@ -85,14 +113,69 @@ class AMTControlServer:
             )
 
     async def _handle_connected(self, request: web.Request) -> web.Response:
-        """GET /connected - Check if panel is connected."""
-        return web.json_response({"connected": self._amt_server.connected})
+        """GET /connected - Check if panel is connected.
+
+        The state is also sent in an X-Connected header (1/0), so HEAD
+        requests can check it without a body.
+        """
+        connected = self._amt_server.connected
+        return web.json_response(
+            {"connected": connected},
+            headers={"X-Connected": "1" if connected else "0"},
+        )
 
     async def _handle_raw_command(self, request: web.Request) -> web.Response:
         """POST /command/raw - Send raw hex command.
 
         Body: {"command": "41 35", "password": "1234"}
         """
+        return await self._handle_command(request, self._run_raw)
+
+    async def _handle_arm(self, request: web.Request) -> web.Response:
+        """POST /command/arm - Arm panel/partition.
+
+        Body: {"partition": "A", "stay": false, "password": "1234"}
+        """
+        return await self._handle_command(request, self._run_arm)
+
+    async def _handle_disarm(self, request: web.Request) -> web.Response:
+        """POST /command/disarm - Disarm panel/partition.
+
+        Body: {"partition": "A", "password": "1234"}
+        """
+        return await self._handle_command(request, self._run_disarm)
+
+    async def _handle_stay(self, request: web.Request) -> web.Response:
+        """POST /command/stay - Arm in stay mode.
+
+        Body: {"password": "1234"}
+        """
+        # The body is optional for stay
+        return await self._handle_command(request, self._run_stay, require_body=False)
+
+    async def _handle_siren(self, request: web.Request) -> web.Response:
+        """POST /command/siren - Control siren.
+
+        Body: {"action": "on" | "off"}
+        """
+        return await self._handle_command(request, self._run_siren)
+
+    async def _handle_pgm(self, request: web.Request) -> web.Response:
+        """POST /command/pgm - Control PGM output.
+
+        Body: {"number": 1, "action": "on" | "off"}
+        """
+        return await self._handle_command(request, self._run_pgm)
+
+    async def _handle_batch(self, request: web.Request) -> web.Response:
+        """POST /command/batch - Run several commands in one request.
+
+        Body: {"commands": [{"id": 0, "type": "raw", "command": "5B"},
+                            {"id": 1, "type": "arm", "partition": "A"}]}
+
+        Commands run in order; each result carries the command's id (or its
+        index) and a failed command does not stop the ones after it.
+        """
         if not self._amt_server.connected:
             return web.json_response(
                 {"success": False, "error": "No panel connected"},
@@ -107,23 +190,41 @@ class AMTControlServer:
                 status=400,
             )
 
-        command = data.get("command")
-        if not command:
+        commands = data.get("commands") if isinstance(data, dict) else None
+        if not isinstance(commands, list) or not commands:
             return web.json_response(
-                {"success": False, "error": "Missing 'command' field"},
+                {"success": False, "error": "Missing 'commands' list"},
                 status=400,
             )
 
-        password = data.get("password")
-        result = await self._amt_server.send_raw_command(command, password)
-        status_code = 200 if result.get("success") else 400
-        return web.json_response(result, status=status_code)
-
-    async def _handle_arm(self, request: web.Request) -> web.Response:
-        """POST /command/arm - Arm panel/partition.
-
-        Body: {"partition": "A", "stay": false, "password": "1234"}
-        """
+        results = []
+        for index, command in enumerate(commands):
+            if not isinstance(command, dict):
+                result = {"success": False, "error": "Command must be an object"}
+                command = {}
+            else:
+                runner = self._batch_runners.get(command.get("type"))
+                if runner is None:
+                    result = {
+                        "success": False,
+                        "error": f"Unknown command type: {command.get('type')}",
+                    }
+                else:
+                    result = await runner(command)
+            results.append({"id": command.get("id", index), **result})
+
+        return web.json_response({
+            "success": all(result["success"] for result in results),
+            "results": results,
+        })
+
+    async def _handle_command(
+        self,
+        request: web.Request,
+        runner: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]],
+        require_body: bool = True,
+    ) -> web.Response:
+        """Parse a command request body and run it against the panel."""
         if not self._amt_server.connected:
             return web.json_response(
                 {"success": False, "error": "No panel connected"},
@@ -133,11 +234,41 @@ class AMTControlServer:
         try:
             data = await request.json()
         except Exception:
-            return web.json_response(
-                {"success": False, "error": "Invalid JSON body"},
-                status=400,
-            )
+            if require_body:
+                return web.json_response(
+                    {"success": False, "error": "Invalid JSON body"},
+                    status=400,
+                )
+            data = {}
+
+        result = await runner(data)
+        status_code = 200 if result.get("success") else 400
+        return web.json_response(result, status=status_code)
 
+    async def _run_status(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Get the panel status (batch only)."""
+        try:
+            status = await self._amt_server.get_status()
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        return {"success": True, "status": self._status_to_json(status)}
+
+    async def _run_raw(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Send a raw hex command."""
+        command = data.get("command")
+        if not command:
+            return {"success": False, "error": "Missing 'command' field"}
+        if not isinstance(command, str):
+            return {"success": False, "error": "'command' must be a hex string"}
+
+        password = data.get("password")
+        try:
+            return await self._amt_server.send_raw_command(command, password)
+        except (ValueError, AttributeError) as e:
+            return {"success": False, "error": str(e)}
+
+    async def _run_arm(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Arm the panel or a partition."""
         partition = data.get("partition")
         stay = data.get("stay", False)
         password = data.get("password")
@@ -156,32 +287,12 @@ class AMTControlServer:
                 else:
                     await self._amt_server.arm(password)
 
-            return web.json_response({"success": True})
+            return {"success": True}
         except Exception as e:
-            return web.json_response(
-                {"success": False, "error": str(e)},
-                status=400,
-            )
-
-    async def _handle_disarm(self, request: web.Request) -> web.Response:
-        """POST /command/disarm - Disarm panel/partition.
-
-        Body: {"partition": "A", "password": "1234"}
-        """
-        if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
-
-        try:
-            data = await request.json()
-        except Exception:
-            return web.json_response(
-                {"success": False, "error": "Invalid JSON body"},
-                status=400,
-            )
+            return {"success": False, "error": str(e)}
 
+    async def _run_disarm(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Disarm the panel or a partition."""
         partition = data.get("partition")
         password = data.get("password")
 
@@ -191,65 +302,25 @@ class AMTControlServer:
             else:
                 await self._amt_server.disarm(password)
 
-            return web.json_response({"success": True})
+            return {"success": True}
         except Exception as e:
-            return web.json_response(
-                {"success": False, "error": str(e)},
-                status=400,
-            )
-
-    async def _handle_stay(self, request: web.Request) -> web.Response:
-        """POST /command/stay - Arm in stay mode.
-
-        Body: {"password": "1234"}
-        """
-        if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
-
-        try:
-            data = await request.json()
-        except Exception:
-            data = {}
+            return {"success": False, "error": str(e)}
 
+    async def _run_stay(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Arm the panel in stay mode."""
         password = data.get("password")
 
         try:
             await self._amt_server.arm_stay(password)
-            return web.json_response({"success": True})
+            return {"success": True}
         except Exception as e:
-            return web.json_response(
-                {"success": False, "error": str(e)},
-                status=400,
-            )
-
-    async def _handle_siren(self, request: web.Request) -> web.Response:
-        """POST /command/siren - Control siren.
-
-        Body: {"action": "on" | "off"}
-        """
-        if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
-
-        try:
-            data = await request.json()
-        except Exception:
-            return web.json_response(
-                {"success": False, "error": "Invalid JSON body"},
-                status=400,
-            )
+            return {"success": False, "error": str(e)}
 
+    async def _run_siren(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Turn the siren on or off."""
         action = data.get("action")
         if action not in ("on", "off"):
-            return web.json_response(
-                {"success": False, "error": "Action must be 'on' or 'off'"},
-                status=400,
-            )
+            return {"success": False, "error": "Action must be 'on' or 'off'"}
 
         try:
             if action == "on":
@@ -257,46 +328,20 @@ class AMTControlServer:
             else:
                 await self._amt_server.siren_off()
 
-            return web.json_response({"success": True})
+            return {"success": True}
         except Exception as e:
-            return web.json_response(
-                {"success": False, "error": str(e)},
-                status=400,
-            )
-
-    async def _handle_pgm(self, request: web.Request) -> web.Response:
-        """POST /command/pgm - Control PGM output.
-
-        Body: {"number": 1, "action": "on" | "off"}
-        """
-        if not self._amt_server.connected:
-            return web.json_response(
-                {"success": False, "error": "No panel connected"},
-                status=503,
-            )
-
-        try:
-            data = await request.json()
-        except Exception:
-            return web.json_response(
-                {"success": False, "error": "Invalid JSON body"},
-                status=400,
-            )
+            return {"success": False, "error": str(e)}
 
+    async def _run_pgm(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Turn a PGM output on or off."""
         number = data.get("number")
         action = data.get("action")
 
         if not isinstance(number, int) or number < 1 or number > 19:
-            return web.json_response(
-                {"success": False, "error": "PGM number must be 1-19"},
-                status=400,
-            )
+            return {"success": False, "error": "PGM number must be 1-19"}
 
         if action not in ("on", "off"):
-            return web.json_response(
-                {"success": False, "error": "Action must be 'on' or 'off'"},
-                status=400,
-            )
+            return {"success": False, "error": "Action must be 'on' or 'off'"}
 
         try:
             if action == "on":
@@ -304,21 +349,23 @@ class AMTControlServer:
             else:
                 await self._amt_server.deactivate_pgm(number)
 
-            return web.json_response({"success": True})
+            return {"success": True}
         except Exception as e:
-            return web.json_response(
-                {"success": False, "error": str(e)},
-                status=400,
-            )
+            return {"success": False, "error": str(e)}
 
     def _status_to_json(self, status: dict[str, Any]) -> dict[str, Any]:
         """Convert status dict to JSON-serializable format."""
         result = {}
         for key, value in status.items():
-            if isinstance(value, list):
+            if key in _ZONE_MASK_KEYS:
+                # Keep the mask and list the zone numbers whose bit is set
+                result[key] = value
+                result[_ZONE_MASK_KEYS[key]] = [
+                    i + 1 for i in range(value.bit_length()) if value >> i & 1
+                ]
+            elif isinstance(value, (list, tuple)):
                 # Convert lists (zones, PGMs) - include only active ones for compactness
-                if key in ("zones_open", "zones_violated", "zones_bypassed",
-                          "zones_tamper", "zones_short_circuit", "zones_low_battery"):
+                if key in ("zones_tamper", "zones_short_circuit", "zones_low_battery"):
                     # Return list of zone numbers that are True
                     result[key] = [i + 1 for i, v in enumerate(value) if v]
                 elif key == "pgms":
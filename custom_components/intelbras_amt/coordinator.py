@@ -3,119 +3,343 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .server import AMTServer, AMTServerError
 from .const import (
+    DATA_AC_POWER,
+    DATA_BATTERY_CONNECTED,
     DATA_CONNECTED,
-    DATA_ZONES_OPEN,
+    DATA_FIRMWARE,
+    DATA_MAX_ZONES,
+    DATA_MODEL_NAME,
+    DATA_PARTITIONS,
+    DATA_PROBLEM,
+    DATA_SIREN,
+    DATA_ZONES_BYPASSED_MASK,
+    DATA_ZONES_LOW_BATTERY,
+    DATA_ZONES_OPEN_MASK,
+    DATA_ZONES_SHORT_CIRCUIT,
+    DATA_ZONES_TAMPER,
+    DATA_ZONES_VIOLATED_MASK,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    ENTITY_PREFIX,
+    MIN_SCAN_INTERVAL,
+    REFRESH_COOLDOWN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Zone lists stored as bytes (one 0/1 byte per zone) in coordinator data
+_ZONE_KEYS = (
+    DATA_ZONES_TAMPER,
+    DATA_ZONES_SHORT_CIRCUIT,
+    DATA_ZONES_LOW_BATTERY,
+)
+
+
+def _pack_status(status: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a server status with the zone lists stored as bytes."""
+    # bytes compare with a single memcmp in the always_update check
+    return {
+        **status,
+        **{key: bytes(status[key]) for key in _ZONE_KEYS if key in status},
+    }
+
+
 class AMTCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for AMT alarm panel data."""
 
+    __slots__ = (
+        "server",
+        "_last_data",
+        "_last_version",
+        "_polling",
+        "_commands",
+        "_command_worker",
+        "device_info",
+        "connected",
+        "ac_power",
+        "battery_connected",
+        "siren",
+        "problem",
+        "partitions",
+        "zones_tamper",
+        "zones_short_circuit",
+        "zones_low_battery",
+        "zones_count",
+        "zones_open_bits",
+        "zones_violated_bits",
+        "zones_bypassed_bits",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
+        entry: ConfigEntry,
         server: AMTServer,
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
     ) -> None:
         """Initialize the coordinator."""
+        requested = scan_interval
+        scan_interval = max(int(scan_interval or DEFAULT_SCAN_INTERVAL), MIN_SCAN_INTERVAL)
+        if scan_interval != requested:
+            _LOGGER.warning(
+                "Scan interval %s is invalid, using %s seconds",
+                requested,
+                scan_interval,
+            )
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            # Idle panels return identical status; skip listener fan-out then
+            always_update=False,
+            # Command bursts end in a single refresh after a short quiet period
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         self.server = server
-        self._last_data: dict[str, Any] = {DATA_CONNECTED: False}
+        # No status until the panel connects and the first poll succeeds
+        self.last_update_success = False
+        self._last_data: dict[str, Any] = {}
+        # Server status version behind _last_data, None when stale
+        self._last_version: int | None = None
+        # Set while our own poll is waiting on the server
+        self._polling = False
+        server.set_status_callback(self._async_handle_status)
+        # Panel commands are serialized through a single worker task
+        self._commands: asyncio.Queue[
+            tuple[Callable[[], Awaitable[None]], asyncio.Future[None]]
+        ] = asyncio.Queue()
+        self._command_worker: asyncio.Task[None] | None = None
+        # Single device per config entry, shared by all entities
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"{ENTITY_PREFIX.upper()} (porta {entry.data[CONF_PORT]})",
+            manufacturer="Intelbras",
+            model="AMT",
+        )
+        # Hot fields published as attributes so entities skip dict lookups
+        self.connected = False
+        self.ac_power = False
+        self.battery_connected = False
+        self.siren = False
+        self.problem = False
+        self.partitions: dict[str, dict[str, bool]] = {}
+        self.zones_tamper = b""
+        self.zones_short_circuit = b""
+        self.zones_low_battery = b""
+        # Zones the panel reports; zone state bits beyond it are unknown
+        self.zones_count = 0
+        # Zone states as bitmaps (bit N = zone N+1), as parsed by the server
+        self.zones_open_bits = 0
+        self.zones_violated_bits = 0
+        self.zones_bypassed_bits = 0
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from AMT alarm panel."""
         try:
             if not self.server.connected:
                 _LOGGER.debug("Panel not connected, waiting for connection...")
-                # Return last known data with connected=False
-                self._last_data[DATA_CONNECTED] = False
-                return self._last_data
+                # Failing the update makes every entity unavailable via
+                # last_update_success; the last good data is left untouched
+                self._last_version = None
+                self.connected = False
+                raise UpdateFailed("Panel not connected")
 
-            data = await self.server.get_status()
+            self._polling = True
+            try:
+                status = await self.server.get_status()
+            finally:
+                self._polling = False
+            version = self.server.status_version
+            if version == self._last_version:
+                # Same frame as last time: nothing to repack or republish
+                return self._last_data
+            data = _pack_status(status)
+            self._publish(data)
             self._last_data = data
+            self._last_version = version
             return data
 
         except AMTServerError as err:
             _LOGGER.warning("Error communicating with AMT: %s", err)
-            # Return last known data with connected=False
-            self._last_data[DATA_CONNECTED] = False
+            self._last_version = None
+            self.connected = False
             raise UpdateFailed(f"Error communicating with AMT: {err}") from err
 
+    async def _async_handle_status(self, status: dict[str, Any]) -> None:
+        """Push a status fetched outside our own polls to the entities.
+
+        The panel only reports status when asked, but requests made through
+        the control server return the same data; publishing it here also
+        pushes back the next scheduled poll. The server only calls this when
+        the status frame changed.
+        """
+        if self._polling:
+            return
+        data = _pack_status(status)
+        self._publish(data)
+        self._last_data = data
+        self._last_version = self.server.status_version
+        self.async_set_updated_data(data)
+
+    def _publish(self, data: dict[str, Any]) -> None:
+        """Publish the hot status fields as coordinator attributes."""
+        self.ac_power = data.get(DATA_AC_POWER, False)
+        self.battery_connected = data.get(DATA_BATTERY_CONNECTED, False)
+        self.siren = data.get(DATA_SIREN, False)
+        self.problem = data.get(DATA_PROBLEM, False)
+        self.partitions = data.get(DATA_PARTITIONS, {})
+        self.zones_tamper = data.get(DATA_ZONES_TAMPER, b"")
+        self.zones_short_circuit = data.get(DATA_ZONES_SHORT_CIRCUIT, b"")
+        self.zones_low_battery = data.get(DATA_ZONES_LOW_BATTERY, b"")
+        self.zones_count = data.get(DATA_MAX_ZONES, 0)
+        self.zones_open_bits = data.get(DATA_ZONES_OPEN_MASK, 0)
+        self.zones_violated_bits = data.get(DATA_ZONES_VIOLATED_MASK, 0)
+        self.zones_bypassed_bits = data.get(DATA_ZONES_BYPASSED_MASK, 0)
+        self.connected = data.get(DATA_CONNECTED, False)
+
+        device_info = self.device_info
+        current = (device_info["model"], device_info.get("sw_version"))
+        model_name = data.get(DATA_MODEL_NAME) or current[0]
+        firmware = data.get(DATA_FIRMWARE) or current[1]
+        if (model_name, firmware) != current:
+            self._update_device_model(model_name, firmware)
+
+    def _update_device_model(self, model_name: str, firmware: str | None) -> None:
+        """Update the shared device info and registry with model and firmware."""
+        self.device_info["model"] = model_name
+        self.device_info["sw_version"] = firmware
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers=self.device_info["identifiers"]
+        )
+        if device:
+            device_registry.async_update_device(
+                device.id, model=model_name, sw_version=firmware
+            )
+
+    async def _async_submit(self, command: Callable[[], Awaitable[None]]) -> None:
+        """Queue a panel command and wait for it to be sent.
+
+        Commands queued while the worker is busy are sent back-to-back and
+        followed by a single refresh instead of one refresh per command.
+        """
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._commands.put_nowait((command, future))
+        if self._command_worker is None or self._command_worker.done():
+            self._command_worker = self.hass.async_create_background_task(
+                self._async_process_commands(), f"{DOMAIN} command worker"
+            )
+        await future
+
+    async def _async_process_commands(self) -> None:
+        """Drain the command queue, then refresh once."""
+        while True:
+            while not self._commands.empty():
+                command, future = self._commands.get_nowait()
+                try:
+                    await command()
+                except asyncio.CancelledError:
+                    # Shutdown: release the caller waiting on this command
+                    future.cancel()
+                    raise
+                except Exception as err:  # pylint: disable=broad-except
+                    if not future.done():
+                        future.set_exception(err)
+                else:
+                    if not future.done():
+                        future.set_result(None)
+            await self.async_request_refresh()
+            if self._commands.empty():
+                return
+
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        if self._command_worker is not None:
+            self._command_worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._command_worker
+            self._command_worker = None
+        while not self._commands.empty():
+            _, future = self._commands.get_nowait()
+            future.cancel()
+        # Cancels the debounced refresh and the scheduled poll
+        await super().async_shutdown()
         await self.server.stop()
 
     async def async_arm(self, code: str | None = None) -> None:
         """Arm the alarm panel."""
-        await self.server.arm(code)
-        await self.async_request_refresh()
+        await self._async_submit(partial(self.server.arm, code))
 
     async def async_disarm(self, code: str | None = None) -> None:
         """Disarm the alarm panel."""
-        await self.server.disarm(code)
-        await self.async_request_refresh()
+        await self._async_submit(partial(self.server.disarm, code))
 
     async def async_arm_stay(self, code: str | None = None) -> None:
         """Arm in stay mode."""
-        await self.server.arm_stay(code)
-        await self.async_request_refresh()
+        await self._async_submit(partial(self.server.arm_stay, code))
 
     async def async_arm_partition(self, partition: str, code: str | None = None) -> None:
         """Arm a specific partition."""
-        await self.server.arm_partition(partition, code)
-        await self.async_request_refresh()
+        await self._async_submit(partial(self.server.arm_partition, partition, code))
 
     async def async_arm_stay_partition(self, partition: str, code: str | None = None) -> None:
         """Arm a specific partition in stay mode."""
-        await self.server.arm_stay_partition(partition, code)
-        await self.async_request_refresh()
+        await self._async_submit(
+            partial(self.server.arm_stay_partition, partition, code)
+        )
 
     async def async_disarm_partition(self, partition: str, code: str | None = None) -> None:
         """Disarm a specific partition."""
-        await self.server.disarm_partition(partition, code)
-        await self.async_request_refresh()
+        await self._async_submit(
+            partial(self.server.disarm_partition, partition, code)
+        )
 
     async def async_activate_pgm(self, pgm_number: int) -> None:
         """Activate a PGM output."""
-        await self.server.activate_pgm(pgm_number)
-        await self.async_request_refresh()
+        await self._async_submit(partial(self.server.activate_pgm, pgm_number))
 
     async def async_deactivate_pgm(self, pgm_number: int) -> None:
         """Deactivate a PGM output."""
-        await self.server.deactivate_pgm(pgm_number)
-        await self.async_request_refresh()
+        await self._async_submit(partial(self.server.deactivate_pgm, pgm_number))
 
     async def async_bypass_open_zones(self) -> None:
         """Bypass all currently open zones."""
-        if self.data and DATA_CONNECTED in self.data:
-            open_zones = self.data.get(DATA_ZONES_OPEN, [])
-            await self.server.bypass_open_zones(open_zones)
-            await self.async_request_refresh()
+        # Nothing to send when disconnected or no zone is open
+        if not self.connected or not self.zones_open_bits:
+            return
+        await self._async_submit(
+            partial(
+                self.server.bypass_open_zones, self.zones_open_bits, self.zones_count
+            )
+        )
 
     async def async_siren_on(self) -> None:
         """Turn siren on."""
-        await self.server.siren_on()
-        await self.async_request_refresh()
+        await self._async_submit(self.server.siren_on)
 
     async def async_siren_off(self) -> None:
         """Turn siren off."""
-        await self.server.siren_off()
-        await self.async_request_refresh()
+        await self._async_submit(self.server.siren_off)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -10,22 +11,20 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PORT, PERCENTAGE, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE, EntityCategory
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DATA_BATTERY_LEVEL,
-    DATA_CONNECTED,
     DATA_FIRMWARE,
     DATA_MODEL_NAME,
     DATA_ZONES_BYPASSED_COUNT,
     DATA_ZONES_OPEN_COUNT,
     DATA_ZONES_VIOLATED_COUNT,
     DOMAIN,
-    ENTITY_PREFIX,
 )
 from .coordinator import AMTCoordinator
 
@@ -55,7 +54,11 @@ async def async_setup_entry(
 class AMTSensorBase(CoordinatorEntity[AMTCoordinator], SensorEntity):
     """Base class for AMT sensors."""
 
+    __slots__ = ("_last_state",)
+
     _attr_has_entity_name = True
+    # Appended to the entry ID to build the unique_id
+    _unique_id_suffix: str
 
     def __init__(
         self,
@@ -64,171 +67,138 @@ class AMTSensorBase(CoordinatorEntity[AMTCoordinator], SensorEntity):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._entry = entry
+        self._last_state: tuple[bool, Any] | None = None
+        self._attr_unique_id = entry.entry_id + self._unique_id_suffix
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
-        )
+        return self.coordinator.device_info
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or the value changes."""
+        state = (self.available, self.native_value)
+        if state != self._last_state:
+            self._last_state = state
+            self.async_write_ha_state()
 
 
 class AMTBatteryLevelSensor(AMTSensorBase):
     """Battery level sensor."""
 
+    __slots__ = ()
+
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_name = "Nível da Bateria"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the battery sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_battery_level"
+    _unique_id_suffix = "_battery_level"
 
     @property
     def native_value(self) -> int | None:
         """Return the battery level."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_BATTERY_LEVEL)
+        return data.get(DATA_BATTERY_LEVEL)
 
 
 class AMTModelSensor(AMTSensorBase):
     """Model sensor."""
 
+    __slots__ = ()
+
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Also shown on the device page; off by default to save recorder rows
+    _attr_entity_registry_enabled_default = False
     _attr_name = "Modelo"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the model sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_model"
+    _unique_id_suffix = "_model"
 
     @property
     def native_value(self) -> str | None:
         """Return the model name."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_MODEL_NAME)
+        return data.get(DATA_MODEL_NAME)
 
 
 class AMTFirmwareSensor(AMTSensorBase):
     """Firmware version sensor."""
 
+    __slots__ = ()
+
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Also shown on the device page; off by default to save recorder rows
+    _attr_entity_registry_enabled_default = False
     _attr_name = "Firmware"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the firmware sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_firmware"
+    _unique_id_suffix = "_firmware"
 
     @property
     def native_value(self) -> str | None:
         """Return the firmware version."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_FIRMWARE)
+        return data.get(DATA_FIRMWARE)
 
 
 class AMTZonesOpenCountSensor(AMTSensorBase):
     """Zones open count sensor."""
 
+    __slots__ = ()
+
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:door-open"
     _attr_name = "Zonas Abertas"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the zones open count sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_zones_open_count"
+    _unique_id_suffix = "_zones_open_count"
 
     @property
     def native_value(self) -> int | None:
         """Return the number of open zones."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_ZONES_OPEN_COUNT, 0)
+        return data.get(DATA_ZONES_OPEN_COUNT, 0)
 
 
 class AMTZonesViolatedCountSensor(AMTSensorBase):
     """Zones violated count sensor."""
 
+    __slots__ = ()
+
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:alert-circle"
     _attr_name = "Zonas Violadas"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the zones violated count sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_zones_violated_count"
+    _unique_id_suffix = "_zones_violated_count"
 
     @property
     def native_value(self) -> int | None:
         """Return the number of violated zones."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_ZONES_VIOLATED_COUNT, 0)
+        return data.get(DATA_ZONES_VIOLATED_COUNT, 0)
 
 
 class AMTZonesBypassedCountSensor(AMTSensorBase):
     """Zones bypassed count sensor."""
 
+    __slots__ = ()
+
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:shield-link-variant"
     _attr_name = "Zonas Anuladas"
-
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the zones bypassed count sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_zones_bypassed_count"
+    _unique_id_suffix = "_zones_bypassed_count"
 
     @property
     def native_value(self) -> int | None:
         """Return the number of bypassed zones."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return self.coordinator.data.get(DATA_ZONES_BYPASSED_COUNT, 0)
+        return data.get(DATA_ZONES_BYPASSED_COUNT, 0)
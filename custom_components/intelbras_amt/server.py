@@ -3,31 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+from functools import reduce
 import logging
-from typing import Any, Callable, Awaitable
+from operator import xor
+import struct
+from typing import Any, Callable, Awaitable, Sequence
 
 from .const import (
+    ARM_PARTITION_CMDS,
     CMD_ARM,
-    CMD_ARM_PARTITION_A,
-    CMD_ARM_PARTITION_B,
-    CMD_ARM_PARTITION_C,
-    CMD_ARM_PARTITION_D,
     CMD_BYPASS,
     CMD_CONNECTION_INFO,
     CMD_DISARM,
-    CMD_DISARM_PARTITION_A,
-    CMD_DISARM_PARTITION_B,
-    CMD_DISARM_PARTITION_C,
-    CMD_DISARM_PARTITION_D,
-    CMD_PGM_OFF_PREFIX,
-    CMD_PGM_ON_PREFIX,
     CMD_SIREN_OFF,
     CMD_SIREN_ON,
     CMD_STAY,
-    CMD_STAY_PARTITION_A,
-    CMD_STAY_PARTITION_B,
-    CMD_STAY_PARTITION_C,
-    CMD_STAY_PARTITION_D,
     CMD_STATUS,
     CONNECTION_TIMEOUT,
     DATA_AC_POWER,
@@ -54,16 +44,17 @@ from .const import (
     DATA_SIREN_WIRE_CUT,
     DATA_STAY,
     DATA_TRIGGERED,
-    DATA_ZONES_BYPASSED,
     DATA_ZONES_BYPASSED_COUNT,
+    DATA_ZONES_BYPASSED_MASK,
     DATA_ZONES_LOW_BATTERY,
-    DATA_ZONES_OPEN,
     DATA_ZONES_OPEN_COUNT,
+    DATA_ZONES_OPEN_MASK,
     DATA_ZONES_SHORT_CIRCUIT,
     DATA_ZONES_TAMPER,
-    DATA_ZONES_VIOLATED,
     DATA_ZONES_VIOLATED_COUNT,
+    DATA_ZONES_VIOLATED_MASK,
     DEFAULT_SERVER_HOST,
+    DISARM_PARTITION_CMDS,
     FRAME_ACK,
     FRAME_HEARTBEAT,
     FRAME_SEPARATOR,
@@ -78,11 +69,64 @@ from .const import (
     MODEL_AMT_4010_SMART,
     MODEL_NAMES,
     NACK_MESSAGES,
+    PGM_OFF_CMDS,
+    PGM_ON_CMDS,
     RESPONSE_TIMEOUT,
+    STAY_PARTITION_CMDS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# ACK frame: [01] [FE] [checksum]; constant, so built once
+_ACK_FRAME = bytes((0x01, FRAME_ACK, 0x01 ^ FRAME_ACK ^ 0xFF))
+# Heartbeats are a single byte and carry no data
+_HEARTBEAT_FRAME = bytes((FRAME_HEARTBEAT,))
+
+# Per-connection receive buffer; a frame is at most 257 bytes, so the
+# unparsed tail left after each read always leaves room for the next one
+_READ_BUFFER_SIZE = 4096
+
+# Status content fields after the zone bytes: 24 model, 26 firmware,
+# 27-28 partitions AB/CD, 29 central status, 39 power, 40 battery level,
+# 41 PGM/siren. Shorter frames are zero-padded up to its size.
+_STATUS_STRUCT = struct.Struct("<24xBxBBBB9xBBB")
+
+# Status byte decoders, indexed by the raw byte (or nibble for partitions).
+# Partition dicts are shared between parses and must be treated as read-only.
+_PARTITION_STATUS = tuple(
+    {"armed": bool(b & 0x01), "stay": bool(b & 0x02), "triggered": bool(b & 0x04)}
+    for b in range(16)
+)
+# (armed, stay, triggered)
+_CENTRAL_STATUS = tuple(
+    (bool(b & 0x08), bool(b & 0x10), bool(b & 0x04)) for b in range(256)
+)
+# (ac_power, battery_connected, battery_low)
+_POWER_STATUS = tuple(
+    (bool(b & 0x80), not b & 0x40, bool(b & 0x20)) for b in range(256)
+)
+
+# PGM 1-7 states from bits 1-7 of the PGM/siren byte (bit 0 is the siren);
+# PGMs 8 and up are not reported and stay False
+_PGM_STATUS = tuple(
+    tuple(bool(b >> bit & 1) for bit in range(1, 8)) + (False,) * (MAX_PGMS - 7)
+    for b in range(256)
+)
+
+# Model name per model ID byte, unknown IDs included
+_MODEL_NAMES = tuple(MODEL_NAMES.get(i, f"AMT (0x{i:02x})") for i in range(256))
+
+# The 0x5B status carries no tamper/short-circuit/low-battery data; these
+# all-False states are shared between parses
+_EMPTY_TAMPER = (False,) * MAX_ZONES_TAMPER
+_EMPTY_SHORT_CIRCUIT = (False,) * MAX_ZONES_SHORT_CIRCUIT
+_EMPTY_LOW_BATTERY = (False,) * MAX_ZONES_LOW_BATTERY
+
+# Partition letter -> command
+_ARM_PARTITION_CMDS = dict(zip("ABCD", ARM_PARTITION_CMDS))
+_STAY_PARTITION_CMDS = dict(zip("ABCD", STAY_PARTITION_CMDS))
+_DISARM_PARTITION_CMDS = dict(zip("ABCD", DISARM_PARTITION_CMDS))
+
 
 class AMTServerError(Exception):
     """Base exception for AMT server errors."""
@@ -111,17 +155,22 @@ class AMTConnection:
 
     def __init__(
         self,
-        reader: asyncio.StreamReader,
-        writer: asyncio.StreamWriter,
+        transport: asyncio.Transport,
         address: tuple[str, int],
     ) -> None:
         """Initialize the connection."""
-        self.reader = reader
-        self.writer = writer
+        self.transport = transport
         self.address = address
+        # Preallocated receive buffer the transport reads straight into;
+        # buffered is the number of bytes not yet parsed into frames
+        self.buffer = bytearray(_READ_BUFFER_SIZE)
+        self.view = memoryview(self.buffer)
+        self.buffered = 0
         self.account: str | None = None
         self.mac_suffix: str | None = None
         self.pending_response: asyncio.Future | None = None
+        # Frames queued by frame handlers, written once per read
+        self.pending_out = bytearray()
         self.last_heartbeat: float = 0
         self._lock = asyncio.Lock()
 
@@ -130,13 +179,35 @@ class AMTConnection:
         """Return connection identifier."""
         return f"{self.address[0]}:{self.address[1]}"
 
-    async def close(self) -> None:
+    def close(self) -> None:
         """Close the connection."""
-        try:
-            self.writer.close()
-            await self.writer.wait_closed()
-        except Exception:
-            pass
+        self.transport.close()
+
+
+class AMTProtocol(asyncio.BufferedProtocol):
+    """Read a panel socket into its connection buffer and parse the frames."""
+
+    def __init__(self, server: AMTServer) -> None:
+        """Initialize the protocol."""
+        self._server = server
+        self._connection: AMTConnection | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Register the new panel connection with the server."""
+        self._connection = self._server._handle_connect(transport)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return the free part of the connection's receive buffer."""
+        connection = self._connection
+        return connection.view[connection.buffered:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Process the bytes just read into the receive buffer."""
+        self._server._handle_data(self._connection, nbytes)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Unregister the panel connection."""
+        self._server._handle_disconnect(self._connection)
 
 
 class AMTServer:
@@ -152,13 +223,26 @@ class AMTServer:
         self._host = host
         self._port = port
         self._password = password
+        # Password is sent as ASCII characters; encoded once for the default
+        self._password_bytes = password.encode('ascii')
         self._server: asyncio.Server | None = None
+        # Set in start(); frames and commands only occur while running
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._connection: AMTConnection | None = None
         self._running = False
         self._lock = asyncio.Lock()
         self._partition_passwords: dict[str, str] = {}
         self._status_callback: Callable[[dict[str, Any]], Awaitable[None]] | None = None
         self._last_status: dict[str, Any] | None = None
+        # Raw frame behind _last_status; the version changes only with it
+        self._last_raw: bytes | None = None
+        self._status_version = 0
+        # Panel-initiated frames, handled before any pending command response
+        self._frame_handlers: dict[
+            int, Callable[[AMTConnection, bytes], None]
+        ] = {
+            CMD_CONNECTION_INFO: self._handle_connection_info,
+        }
 
     def set_partition_passwords(
         self,
@@ -180,7 +264,7 @@ class AMTServer:
     def set_status_callback(
         self, callback: Callable[[dict[str, Any]], Awaitable[None]]
     ) -> None:
-        """Set callback for status updates."""
+        """Set callback for status changes (called only when the status frame changes)."""
         self._status_callback = callback
 
     @property
@@ -193,13 +277,19 @@ class AMTServer:
         """Return the last received status."""
         return self._last_status
 
+    @property
+    def status_version(self) -> int:
+        """Return a counter bumped whenever the panel status changes."""
+        return self._status_version
+
     async def start(self) -> None:
         """Start the TCP server."""
         if self._running:
             return
 
-        self._server = await asyncio.start_server(
-            self._handle_client,
+        self._loop = asyncio.get_running_loop()
+        self._server = await self._loop.create_server(
+            lambda: AMTProtocol(self),
             self._host,
             self._port,
             reuse_address=True,
@@ -213,7 +303,7 @@ class AMTServer:
         self._running = False
 
         if self._connection:
-            await self._connection.close()
+            self._connection.close()
             self._connection = None
 
         if self._server:
@@ -225,110 +315,113 @@ class AMTServer:
 
     def _calculate_checksum(self, data: bytes) -> int:
         """Calculate XOR checksum for the frame (XOR all bytes, then XOR with 0xFF)."""
-        checksum = 0
-        for byte in data:
-            checksum ^= byte
-        return checksum ^ 0xFF
+        return reduce(xor, data, 0) ^ 0xFF
 
     def _build_frame(self, command: bytes, password: str | None = None) -> bytes:
         """Build a protocol frame with checksum."""
-        pwd = password or self._password
-        # Password is sent as ASCII characters
-        pwd_bytes = pwd.encode('ascii')
+        pwd_bytes = password.encode('ascii') if password else self._password_bytes
 
         # Frame: [Length] [0xE9] [0x21] [PASSWORD_ASCII] [COMMAND] [0x21] [CHECKSUM]
-        inner = bytes([FRAME_START, FRAME_SEPARATOR]) + pwd_bytes + command + bytes([FRAME_SEPARATOR])
+        frame = bytearray((0, FRAME_START, FRAME_SEPARATOR))
+        frame += pwd_bytes
+        frame += command
+        frame.append(FRAME_SEPARATOR)
 
         # Length = command byte + content (not including length byte and checksum)
-        length = len(inner)
-
-        frame_without_checksum = bytes([length]) + inner
-        checksum = self._calculate_checksum(frame_without_checksum)
-        return frame_without_checksum + bytes([checksum])
-
-    def _build_ack_frame(self) -> bytes:
-        """Build a simple ACK frame."""
-        # ACK frame: [02] [FE] [checksum]
-        frame = bytes([0x01, FRAME_ACK])
-        checksum = self._calculate_checksum(frame)
-        return frame + bytes([checksum])
+        frame[0] = len(frame) - 1
+        frame.append(self._calculate_checksum(frame))
+        return bytes(frame)
 
-    async def _handle_client(
-        self,
-        reader: asyncio.StreamReader,
-        writer: asyncio.StreamWriter,
-    ) -> None:
+    def _handle_connect(self, transport: asyncio.Transport) -> AMTConnection:
         """Handle incoming client connection."""
-        addr = writer.get_extra_info('peername')
+        addr = transport.get_extra_info('peername')
         _LOGGER.info("Panel connected from %s:%s", addr[0], addr[1])
 
         # Close existing connection if any
         if self._connection:
             _LOGGER.warning("Closing existing connection from %s", self._connection.id)
-            await self._connection.close()
+            self._connection.close()
 
-        connection = AMTConnection(reader, writer, addr)
+        connection = AMTConnection(transport, addr)
         self._connection = connection
+        return connection
+
+    def _handle_data(self, connection: AMTConnection, nbytes: int) -> None:
+        """Process the frames completed by nbytes just read from a panel."""
+        view = connection.view
+        start = connection.buffered
+        end = start + nbytes
+        _LOGGER.debug("Received data: %s", view[start:end].hex())
+        buffer = view[:end]
+        # Start of unprocessed data in buffer
+        pos = 0
 
         try:
-            buffer = bytearray()
-            while self._running:
-                try:
-                    data = await asyncio.wait_for(reader.read(1024), timeout=60)
-                    if not data:
-                        break
-
-                    buffer.extend(data)
-                    _LOGGER.debug("Received data: %s", data.hex())
-
-                    # Process complete frames from buffer
-                    while len(buffer) > 0:
-                        frame = self._extract_frame(buffer)
-                        if frame is None:
-                            break
-                        await self._process_frame(connection, frame)
-
-                except asyncio.TimeoutError:
-                    # No data for 60 seconds, but connection still valid
-                    continue
-
+            # Process complete frames from buffer
+            while pos < end:
+                frame, pos = self._extract_frame(buffer, pos)
+                if frame is None:
+                    break
+                self._process_frame(connection, frame)
         except Exception as e:
             _LOGGER.error("Error handling client: %s", e)
-        finally:
-            if self._connection == connection:
-                self._connection = None
-            await connection.close()
-            _LOGGER.info("Panel disconnected from %s:%s", addr[0], addr[1])
+            connection.close()
+            return
 
-    def _extract_frame(self, buffer: bytearray) -> bytes | None:
-        """Extract a complete frame from the buffer."""
-        if len(buffer) < 1:
-            return None
+        # Move the unparsed tail (at most one partial frame) to the front
+        # once per read, not once per frame
+        remaining = end - pos
+        if pos and remaining:
+            view[:remaining] = view[pos:end]
+        connection.buffered = remaining
+
+        # Send all ACKs for this read in a single write
+        if connection.pending_out:
+            connection.transport.write(bytes(connection.pending_out))
+            connection.pending_out.clear()
+
+    def _handle_disconnect(self, connection: AMTConnection) -> None:
+        """Handle a closed client connection."""
+        if self._connection is connection:
+            self._connection = None
+        _LOGGER.info(
+            "Panel disconnected from %s:%s", connection.address[0], connection.address[1]
+        )
+
+    def _extract_frame(
+        self, buffer: memoryview, pos: int
+    ) -> tuple[bytes | None, int]:
+        """Extract a complete frame starting at pos in the buffer.
+
+        Returns the frame (or None) and the position after consumed bytes.
+        """
+        available = len(buffer) - pos
+        if available < 1:
+            return None, pos
 
         # Check for heartbeat (single byte 0xF7)
-        if buffer[0] == FRAME_HEARTBEAT:
-            frame = bytes([buffer.pop(0)])
-            return frame
+        if buffer[pos] == FRAME_HEARTBEAT:
+            return _HEARTBEAT_FRAME, pos + 1
 
         # Normal frame: first byte is length
-        if len(buffer) < 3:
-            return None
+        if available < 3:
+            return None, pos
 
-        length = buffer[0]
+        length = buffer[pos]
         total_size = length + 2  # length byte + content + checksum
 
-        if len(buffer) < total_size:
-            return None
+        if available < total_size:
+            return None, pos
 
-        frame = bytes(buffer[:total_size])
-        del buffer[:total_size]
+        end = pos + total_size
+        frame = bytes(buffer[pos:end])
 
         # Validate checksum
         if not self._validate_checksum(frame):
             _LOGGER.warning("Invalid checksum in frame: %s", frame.hex())
-            return None
+            return None, end
 
-        return frame
+        return frame, end
 
     def _validate_checksum(self, frame: bytes) -> bool:
         """Validate frame checksum."""
@@ -338,15 +431,13 @@ class AMTServer:
         expected = self._calculate_checksum(data)
         return frame[-1] == expected
 
-    async def _process_frame(self, connection: AMTConnection, frame: bytes) -> None:
+    def _process_frame(self, connection: AMTConnection, frame: bytes) -> None:
         """Process a received frame."""
-        # Heartbeat
-        if len(frame) == 1 and frame[0] == FRAME_HEARTBEAT:
+        # Heartbeat (_extract_frame always returns the shared constant)
+        if frame is _HEARTBEAT_FRAME:
             _LOGGER.debug("Heartbeat received, sending ACK")
-            ack = self._build_ack_frame()
-            connection.writer.write(ack)
-            await connection.writer.drain()
-            connection.last_heartbeat = asyncio.get_event_loop().time()
+            connection.pending_out += _ACK_FRAME
+            connection.last_heartbeat = self._loop.time()
             return
 
         if len(frame) < 3:
@@ -357,9 +448,10 @@ class AMTServer:
 
         _LOGGER.debug("Frame: cmd=0x%02X, content=%s", command, content.hex())
 
-        # Connection info (0x94) - panel identifying itself
-        if command == CMD_CONNECTION_INFO:
-            await self._handle_connection_info(connection, content)
+        # Connection info (0x94) and other panel-initiated frames
+        handler = self._frame_handlers.get(command)
+        if handler is not None:
+            handler(connection, content)
             return
 
         # Check if this is a response to a pending command
@@ -372,7 +464,7 @@ class AMTServer:
             # This might be a status update or response
             _LOGGER.debug("ISECMobile frame received: %s", content.hex())
 
-    async def _handle_connection_info(
+    def _handle_connection_info(
         self, connection: AMTConnection, content: bytes
     ) -> None:
         """Handle connection info command (0x94)."""
@@ -388,30 +480,28 @@ class AMTServer:
             connection.mac_suffix,
         )
 
-        # Send ACK
-        ack = self._build_ack_frame()
-        connection.writer.write(ack)
-        await connection.writer.drain()
+        # Queue ACK, sent after the current read is processed
+        connection.pending_out += _ACK_FRAME
 
     async def _send_command(self, command: bytes, password: str | None = None) -> bytes:
         """Send a command and wait for response."""
-        if not self._connection:
+        connection = self._connection
+        if not connection:
             raise AMTConnectionError("No panel connected")
 
-        async with self._connection._lock:
+        async with connection._lock:
             frame = self._build_frame(command, password)
             _LOGGER.debug("Sending command: %s", frame.hex())
 
             # Set up response future
-            self._connection.pending_response = asyncio.get_event_loop().create_future()
+            connection.pending_response = self._loop.create_future()
 
             try:
-                self._connection.writer.write(frame)
-                await self._connection.writer.drain()
+                connection.transport.write(frame)
 
                 # Wait for response
                 response = await asyncio.wait_for(
-                    self._connection.pending_response,
+                    connection.pending_response,
                     timeout=RESPONSE_TIMEOUT,
                 )
                 _LOGGER.debug("Response received: %s", response.hex())
@@ -419,7 +509,8 @@ class AMTServer:
                 # Check for NACK
                 if len(response) >= 3 and response[1] == FRAME_START:
                     resp_content = response[2:-1]
-                    if len(resp_content) >= 1 and 0xE0 <= resp_content[0] <= 0xEF:
+                    # NACK codes are 0xE0-0xEF
+                    if len(resp_content) >= 1 and resp_content[0] & 0xF0 == 0xE0:
                         raise AMTNackError(resp_content[0])
 
                 return response
@@ -427,29 +518,7 @@ class AMTServer:
             except asyncio.TimeoutError as err:
                 raise AMTConnectionError("Response timeout") from err
             finally:
-                self._connection.pending_response = None
-
-    def _parse_zones(self, data: bytes, offset: int, max_zones: int) -> list[bool]:
-        """Parse zone status bytes into a list of booleans."""
-        zones = []
-        for byte_idx in range(8):  # 8 bytes = 64 zones max
-            if offset + byte_idx >= len(data):
-                break
-            byte = data[offset + byte_idx]
-            for bit in range(8):
-                zone_num = byte_idx * 8 + bit
-                if zone_num >= max_zones:
-                    break
-                zones.append(bool(byte & (1 << bit)))
-        return zones[:max_zones]
-
-    def _parse_partition_status(self, status_byte: int) -> dict[str, bool]:
-        """Parse partition status byte."""
-        return {
-            "armed": bool(status_byte & 0x01),
-            "stay": bool(status_byte & 0x02),
-            "triggered": bool(status_byte & 0x04),
-        }
+                connection.pending_response = None
 
     def _parse_response(self, data: bytes) -> dict[str, Any]:
         """Parse status response into structured data."""
@@ -471,69 +540,63 @@ class AMTServer:
 
         max_zones = MAX_ZONES_4010  # Default, will be updated if model detected
 
-        # Parse zone lists from content
-        zones_open = self._parse_zones(content, 0, max_zones)
-        zones_violated = self._parse_zones(content, 8, max_zones)
-        zones_bypassed = self._parse_zones(content, 16, max_zones)
+        # Zones as bitmasks (bit N = zone N+1)
+        zones_open_mask = int.from_bytes(content[0:8], "little")
+        zones_violated_mask = int.from_bytes(content[8:16], "little")
+        zones_bypassed_mask = int.from_bytes(content[16:24], "little")
 
         # Calculate zone counts
-        zones_open_count = sum(zones_open)
-        zones_violated_count = sum(zones_violated)
-        zones_bypassed_count = sum(zones_bypassed)
-
-        # Parse model ID from content (position may vary)
-        model_id = content[24] if len(content) > 24 else 0
-        model_name = MODEL_NAMES.get(model_id, f"AMT (0x{model_id:02x})")
+        zones_open_count = zones_open_mask.bit_count()
+        zones_violated_count = zones_violated_mask.bit_count()
+        zones_bypassed_count = zones_bypassed_mask.bit_count()
+
+        # Fixed-position status bytes; missing trailing bytes read as 0
+        (
+            model_id,
+            firmware_byte,
+            part_ab,
+            part_cd,
+            central_status,
+            power_status,
+            battery_level,
+            pgm_byte,
+        ) = _STATUS_STRUCT.unpack_from(content.ljust(_STATUS_STRUCT.size, b"\0"))
+
+        # Model ID (position may vary)
+        model_name = _MODEL_NAMES[model_id]
 
         # Adjust max zones based on model
         if model_id == MODEL_AMT_2018:
             max_zones = MAX_ZONES_2018
-            zones_open = zones_open[:max_zones]
-            zones_violated = zones_violated[:max_zones]
-            zones_bypassed = zones_bypassed[:max_zones]
+            zone_bits = (1 << max_zones) - 1
+            zones_open_mask &= zone_bits
+            zones_violated_mask &= zone_bits
+            zones_bypassed_mask &= zone_bits
 
         # Parse firmware
-        firmware_byte = content[26] if len(content) > 26 else 0
-        firmware = f"{(firmware_byte >> 4) & 0x0F}.{firmware_byte & 0x0F}"
+        firmware = f"{firmware_byte >> 4}.{firmware_byte & 0x0F}"
 
         # Parse partition status
-        part_ab = content[27] if len(content) > 27 else 0
-        part_cd = content[28] if len(content) > 28 else 0
         partitions = {
-            "A": self._parse_partition_status(part_ab & 0x0F),
-            "B": self._parse_partition_status((part_ab >> 4) & 0x0F),
-            "C": self._parse_partition_status(part_cd & 0x0F),
-            "D": self._parse_partition_status((part_cd >> 4) & 0x0F),
+            "A": _PARTITION_STATUS[part_ab & 0x0F],
+            "B": _PARTITION_STATUS[part_ab >> 4],
+            "C": _PARTITION_STATUS[part_cd & 0x0F],
+            "D": _PARTITION_STATUS[part_cd >> 4],
         }
 
         # Parse central status
-        central_status = content[29] if len(content) > 29 else 0
-        armed = bool(central_status & 0x08)
-        stay = bool(central_status & 0x10)
-        triggered = bool(central_status & 0x04)
+        armed, stay, triggered = _CENTRAL_STATUS[central_status]
 
         # Parse power/battery status
-        power_status = content[39] if len(content) > 39 else 0
-        ac_power = bool(power_status & 0x80)
-        battery_connected = not bool(power_status & 0x40)
-        battery_low = bool(power_status & 0x20)
+        ac_power, battery_connected, battery_low = _POWER_STATUS[power_status]
 
         # Battery level
-        battery_level = content[40] if len(content) > 40 else 0
         if battery_level > 100:
             battery_level = 100
 
         # PGM/Siren status
-        pgm_byte = content[41] if len(content) > 41 else 0
         siren = bool(pgm_byte & 0x01)
-        pgms = [False] * MAX_PGMS
-        for i in range(min(8, MAX_PGMS)):
-            pgms[i] = bool(pgm_byte & (1 << (i + 1))) if i < 7 else False
-
-        # Initialize empty tamper/short-circuit/low-battery arrays
-        zones_tamper = [False] * MAX_ZONES_TAMPER
-        zones_short_circuit = [False] * MAX_ZONES_SHORT_CIRCUIT
-        zones_low_battery = [False] * MAX_ZONES_LOW_BATTERY
+        pgms = _PGM_STATUS[pgm_byte]
 
         return {
             DATA_CONNECTED: True,
@@ -541,15 +604,15 @@ class AMTServer:
             DATA_MODEL_NAME: model_name,
             DATA_MAX_ZONES: max_zones,
             DATA_FIRMWARE: firmware,
-            DATA_ZONES_OPEN: zones_open,
-            DATA_ZONES_VIOLATED: zones_violated,
-            DATA_ZONES_BYPASSED: zones_bypassed,
-            DATA_ZONES_TAMPER: zones_tamper,
-            DATA_ZONES_SHORT_CIRCUIT: zones_short_circuit,
-            DATA_ZONES_LOW_BATTERY: zones_low_battery,
+            DATA_ZONES_TAMPER: _EMPTY_TAMPER,
+            DATA_ZONES_SHORT_CIRCUIT: _EMPTY_SHORT_CIRCUIT,
+            DATA_ZONES_LOW_BATTERY: _EMPTY_LOW_BATTERY,
             DATA_ZONES_OPEN_COUNT: zones_open_count,
             DATA_ZONES_VIOLATED_COUNT: zones_violated_count,
             DATA_ZONES_BYPASSED_COUNT: zones_bypassed_count,
+            DATA_ZONES_OPEN_MASK: zones_open_mask,
+            DATA_ZONES_VIOLATED_MASK: zones_violated_mask,
+            DATA_ZONES_BYPASSED_MASK: zones_bypassed_mask,
             DATA_PARTITIONS: partitions,
             DATA_ARMED: armed,
             DATA_STAY: stay,
@@ -574,8 +637,13 @@ class AMTServer:
     async def get_status(self) -> dict[str, Any]:
         """Get current status from the panel."""
         response = await self._send_command(CMD_STATUS)
+        if response == self._last_raw and self._last_status is not None:
+            # Unchanged panel status: nothing new to dispatch
+            return self._last_status
         status = self._parse_response(response)
         self._last_status = status
+        self._last_raw = response
+        self._status_version += 1
         if self._status_callback:
             await self._status_callback(status)
         return status
@@ -594,67 +662,44 @@ class AMTServer:
 
     async def arm_partition(self, partition: str, password: str | None = None) -> None:
         """Arm a specific partition."""
-        commands = {
-            "A": CMD_ARM_PARTITION_A,
-            "B": CMD_ARM_PARTITION_B,
-            "C": CMD_ARM_PARTITION_C,
-            "D": CMD_ARM_PARTITION_D,
-        }
-        if partition not in commands:
+        command = _ARM_PARTITION_CMDS.get(partition)
+        if command is None:
             raise ValueError(f"Invalid partition: {partition}")
 
         pwd = password or self._partition_passwords.get(partition) or self._password
-        await self._send_command(commands[partition], pwd)
+        await self._send_command(command, pwd)
 
     async def arm_stay_partition(self, partition: str, password: str | None = None) -> None:
         """Arm a specific partition in stay mode."""
-        commands = {
-            "A": CMD_STAY_PARTITION_A,
-            "B": CMD_STAY_PARTITION_B,
-            "C": CMD_STAY_PARTITION_C,
-            "D": CMD_STAY_PARTITION_D,
-        }
-        if partition not in commands:
+        command = _STAY_PARTITION_CMDS.get(partition)
+        if command is None:
             raise ValueError(f"Invalid partition: {partition}")
 
         pwd = password or self._partition_passwords.get(partition) or self._password
-        await self._send_command(commands[partition], pwd)
+        await self._send_command(command, pwd)
 
     async def disarm_partition(self, partition: str, password: str | None = None) -> None:
         """Disarm a specific partition."""
-        commands = {
-            "A": CMD_DISARM_PARTITION_A,
-            "B": CMD_DISARM_PARTITION_B,
-            "C": CMD_DISARM_PARTITION_C,
-            "D": CMD_DISARM_PARTITION_D,
-        }
-        if partition not in commands:
+        command = _DISARM_PARTITION_CMDS.get(partition)
+        if command is None:
             raise ValueError(f"Invalid partition: {partition}")
 
         pwd = password or self._partition_passwords.get(partition) or self._password
-        await self._send_command(commands[partition], pwd)
+        await self._send_command(command, pwd)
 
     async def activate_pgm(self, pgm_number: int) -> None:
         """Activate a PGM output."""
         if pgm_number < 1 or pgm_number > MAX_PGMS:
             raise ValueError(f"Invalid PGM number: {pgm_number}")
 
-        if pgm_number < 10:
-            command = CMD_PGM_ON_PREFIX + bytes([0x30, 0x30 + pgm_number])
-        else:
-            command = CMD_PGM_ON_PREFIX + bytes([0x31, 0x30 + (pgm_number - 10)])
-        await self._send_command(command)
+        await self._send_command(PGM_ON_CMDS[pgm_number - 1])
 
     async def deactivate_pgm(self, pgm_number: int) -> None:
         """Deactivate a PGM output."""
         if pgm_number < 1 or pgm_number > MAX_PGMS:
             raise ValueError(f"Invalid PGM number: {pgm_number}")
 
-        if pgm_number < 10:
-            command = CMD_PGM_OFF_PREFIX + bytes([0x30, 0x30 + pgm_number])
-        else:
-            command = CMD_PGM_OFF_PREFIX + bytes([0x31, 0x30 + (pgm_number - 10)])
-        await self._send_command(command)
+        await self._send_command(PGM_OFF_CMDS[pgm_number - 1])
 
     async def siren_on(self) -> None:
         """Turn siren on."""
@@ -664,22 +709,27 @@ class AMTServer:
         """Turn siren off."""
         await self._send_command(CMD_SIREN_OFF)
 
-    async def bypass_zones(self, zone_mask: list[bool]) -> None:
-        """Bypass zones specified in the mask."""
-        mask_bytes = []
-        for i in range(0, len(zone_mask), 8):
-            byte = 0
-            for bit in range(8):
-                if i + bit < len(zone_mask) and zone_mask[i + bit]:
-                    byte |= 1 << bit
-            mask_bytes.append(byte)
-
-        command = CMD_BYPASS + bytes(mask_bytes)
+    async def bypass_zones(
+        self, zone_mask: int | Sequence[bool], max_zones: int = MAX_ZONES_4010
+    ) -> None:
+        """Bypass zones specified in the mask.
+
+        Accepts an int bitmask (bit N = zone N+1, sent as one byte per 8 of
+        max_zones) or a sequence of zone states (8 zones per byte).
+        """
+        if isinstance(zone_mask, int):
+            mask, length = zone_mask, (max_zones + 7) // 8
+        else:
+            mask = sum(1 << idx for idx, state in enumerate(zone_mask) if state)
+            length = (len(zone_mask) + 7) // 8
+        command = CMD_BYPASS + mask.to_bytes(length, "little")
         await self._send_command(command)
 
-    async def bypass_open_zones(self, open_zones: list[bool]) -> None:
+    async def bypass_open_zones(
+        self, open_zones: int | Sequence[bool], max_zones: int = MAX_ZONES_4010
+    ) -> None:
         """Bypass all currently open zones."""
-        await self.bypass_zones(open_zones)
+        await self.bypass_zones(open_zones, max_zones)
 
     async def test_connection(self) -> bool:
         """Test if a panel is connected and responding."""
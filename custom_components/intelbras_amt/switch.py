@@ -7,20 +7,17 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    DATA_CONNECTED,
-    DATA_MODEL_NAME,
     DATA_PGMS,
-    DATA_SIREN,
     DOMAIN,
-    ENTITY_PREFIX,
     MAX_PGMS,
+    PGM_ID_SUFFIXES,
+    PGM_NAMES,
 )
 from .coordinator import AMTCoordinator
 
@@ -50,37 +47,14 @@ async def async_setup_entry(
 class AMTSwitchBase(CoordinatorEntity[AMTCoordinator], SwitchEntity):
     """Base class for AMT switches."""
 
-    _attr_has_entity_name = True
+    __slots__ = ()
 
-    def __init__(
-        self,
-        coordinator: AMTCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator)
-        self._entry = entry
+    _attr_has_entity_name = True
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        model_name = "AMT"
-        if self.coordinator.data:
-            model_name = self.coordinator.data.get(DATA_MODEL_NAME, "AMT")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"{ENTITY_PREFIX.upper()} (porta {self._entry.data[CONF_PORT]})",
-            manufacturer="Intelbras",
-            model=model_name,
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not self.coordinator.data:
-            return False
-        return self.coordinator.data.get(DATA_CONNECTED, False)
+        return self.coordinator.device_info
 
 
 class AMTSirenSwitch(AMTSwitchBase):
@@ -95,15 +69,13 @@ class AMTSirenSwitch(AMTSwitchBase):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the siren switch."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_siren_switch"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if siren is active."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get(DATA_SIREN, False)
+        return self.coordinator.siren
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn siren on."""
@@ -117,6 +89,8 @@ class AMTSirenSwitch(AMTSwitchBase):
 class AMTPGMSwitch(AMTSwitchBase):
     """PGM on/off switch."""
 
+    __slots__ = ("_pgm_num", "_pgm_idx")
+
     _attr_icon = "mdi:electric-switch"
 
     def __init__(
@@ -126,22 +100,20 @@ class AMTPGMSwitch(AMTSwitchBase):
         pgm_num: int,
     ) -> None:
         """Initialize the PGM switch."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator)
         self._pgm_num = pgm_num
-        self._attr_unique_id = f"{entry.entry_id}_pgm_{pgm_num}_switch"
-        self._attr_name = f"PGM {pgm_num}"
+        self._pgm_idx = pgm_num - 1
+        self._attr_unique_id = entry.entry_id + PGM_ID_SUFFIXES[self._pgm_idx]
+        self._attr_name = PGM_NAMES[self._pgm_idx]
 
     @property
     def is_on(self) -> bool | None:
         """Return True if PGM is active."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-
-        pgms = self.coordinator.data.get(DATA_PGMS, [])
-        pgm_idx = self._pgm_num - 1
-        if pgm_idx < len(pgms):
-            return pgms[pgm_idx]
-        return None
+        # The panel status always carries MAX_PGMS states
+        return data[DATA_PGMS][self._pgm_idx]
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Activate the PGM."""
@@ -7,6 +7,10 @@ to send commands to the alarm panel for protocol testing.
 Usage:
     amt_cli status              # Get panel status
     amt_cli connected           # Check if panel is connected
+    amt_cli connected -q        # Exit code only (0 = connected)
+    amt_cli status --cache-ms 1000  # Reuse a status fetched within 1 s
+    amt_cli status --raw        # Print the server's JSON unformatted
+    amt_cli poll -i 2           # Print status every 2 seconds
     amt_cli raw "5B"            # Send raw command (status)
     amt_cli raw "41 35" -p 1234 # Send raw command with password
     amt_cli arm                 # Arm panel
@@ -16,163 +20,460 @@ Usage:
     amt_cli disarm -p 1234      # Disarm panel
     amt_cli siren on            # Turn siren on
     amt_cli pgm 1 on            # Turn PGM 1 on
+    amt_cli batch -c "arm -P A" -c "siren on"  # Several commands, one request
 
 Requirements:
     pip install httpx  (or use requests/urllib)
+    pip install orjson (optional, faster JSON; falls back to json)
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
+from functools import lru_cache
 import json
+import os
+from pathlib import Path
+import re
+import shlex
 import sys
+import time
 from typing import Any
 
 try:
-    import httpx
-    USE_HTTPX = True
+    import orjson
+    USE_ORJSON = True
 except ImportError:
-    import urllib.request
-    import urllib.error
-    USE_HTTPX = False
+    USE_ORJSON = False
 
 DEFAULT_URL = "http://localhost:9019"
+DEFAULT_POOL_MAX = 4
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Request timeouts in seconds. The control server runs on localhost or the
+# LAN, so a connection that takes longer than CONNECT_TIMEOUT is not coming;
+# READ_TIMEOUT leaves room for the panel to answer a command. urllib has a
+# single timeout and uses READ_TIMEOUT.
+CONNECT_TIMEOUT = 2.0
+READ_TIMEOUT = 10.0
+WRITE_TIMEOUT = 5.0
+
+PARTITIONS = ("A", "B", "C", "D")
+ON_OFF = ("on", "off")
+PGM_NUMBERS = frozenset(range(1, 20))
+
+# Separators allowed between hex bytes in raw commands
+HEX_SEPARATORS = re.compile(r"[\s:,-]+")
+
+# Last /status and /connected responses, for --cache-ms
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "amt_cli"
+
+# Shared httpx client, so repeated requests reuse pooled connections.
+# The HTTP library is only picked (and imported) on the first request,
+# so --help and argument errors never load it.
+_client: Any = None
+_use_httpx: bool | None = None
+# httpx connection pool settings, from --pool-max/--keepalive-expiry
+_pool_max = DEFAULT_POOL_MAX
+_keepalive_expiry = DEFAULT_KEEPALIVE_EXPIRY
 
 
 def print_json(data: dict[str, Any], indent: int = 2) -> None:
     """Pretty print JSON data."""
-    print(json.dumps(data, indent=indent, ensure_ascii=False))
+    if USE_ORJSON and indent == 2:
+        # orjson writes UTF-8 bytes directly, like ensure_ascii=False
+        sys.stdout.buffer.write(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(data, indent=indent, ensure_ascii=False))
 
 
-def http_get(url: str) -> dict[str, Any]:
-    """Make HTTP GET request."""
-    if USE_HTTPX:
-        with httpx.Client(timeout=10.0) as client:
-            r = client.get(url)
-            return r.json()
+def print_json_lines(items: list[dict[str, Any]]) -> None:
+    """Pretty print several JSON objects with a single write."""
+    if USE_ORJSON:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        sys.stdout.buffer.writelines(
+            [orjson.dumps(item, option=option) + b"\n" for item in items]
+        )
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(
+            "".join(json.dumps(item, indent=2, ensure_ascii=False) + "\n" for item in items)
+        )
+
+
+def json_loads(raw: bytes) -> Any:
+    """Decode a JSON response body without decoding it to str first."""
+    if USE_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Encode a JSON request body."""
+    if USE_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def configure_client(pool_max: int, keepalive_expiry: float) -> None:
+    """Set the connection pool limits used when the httpx client is created."""
+    global _pool_max, _keepalive_expiry
+    _pool_max = pool_max
+    _keepalive_expiry = keepalive_expiry
+
+
+def _get_client() -> Any:
+    """Return the shared httpx client, or None to fall back to urllib."""
+    global _client, _use_httpx
+    if _use_httpx is None:
+        try:
+            import httpx
+        except ImportError:
+            _use_httpx = False
+            return None
+        _use_httpx = True
+        _client = httpx.Client(
+            timeout=httpx.Timeout(
+                connect=CONNECT_TIMEOUT,
+                read=READ_TIMEOUT,
+                write=WRITE_TIMEOUT,
+                pool=CONNECT_TIMEOUT,
+            ),
+            # Keep the connection open between polls
+            limits=httpx.Limits(
+                max_keepalive_connections=_pool_max,
+                keepalive_expiry=_keepalive_expiry,
+            ),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+def http_get_response(url: str) -> tuple[bytes, Any]:
+    """Make HTTP GET request and return the response body and headers."""
+    client = _get_client()
+    if client is not None:
+        response = client.get(url)
+        return response.content, response.headers
     else:
+        import urllib.error
+        import urllib.request
+
         req = urllib.request.Request(url)
         try:
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return json.loads(response.read().decode())
+            with urllib.request.urlopen(req, timeout=READ_TIMEOUT) as response:
+                return response.read(), response.headers
+        except urllib.error.HTTPError as e:
+            return e.read(), e.headers
+
+
+def http_get_raw(url: str) -> bytes:
+    """Make HTTP GET request and return the response body as received."""
+    return http_get_response(url)[0]
+
+
+def http_head_header(url: str, name: str) -> str | None:
+    """Make HTTP HEAD request and return one response header."""
+    client = _get_client()
+    if client is not None:
+        return client.head(url).headers.get(name)
+    else:
+        import urllib.error
+        import urllib.request
+
+        req = urllib.request.Request(url, method="HEAD")
+        try:
+            with urllib.request.urlopen(req, timeout=READ_TIMEOUT) as response:
+                return response.headers.get(name)
         except urllib.error.HTTPError as e:
-            return json.loads(e.read().decode())
+            return e.headers.get(name)
+
+
+def http_get(url: str) -> dict[str, Any]:
+    """Make HTTP GET request."""
+    return json_loads(http_get_raw(url))
 
 
 def http_post(url: str, data: dict[str, Any]) -> dict[str, Any]:
     """Make HTTP POST request with JSON body."""
-    if USE_HTTPX:
-        with httpx.Client(timeout=10.0) as client:
-            r = client.post(url, json=data)
-            return r.json()
+    client = _get_client()
+    if client is not None:
+        r = client.post(
+            url,
+            content=json_dumps(data),
+            headers={"Content-Type": "application/json"},
+        )
+        return json_loads(r.content)
     else:
+        import urllib.error
+        import urllib.request
+
         req = urllib.request.Request(
             url,
-            data=json.dumps(data).encode(),
+            data=json_dumps(data),
             headers={"Content-Type": "application/json"},
             method="POST",
         )
         try:
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return json.loads(response.read().decode())
+            with urllib.request.urlopen(req, timeout=READ_TIMEOUT) as response:
+                return json_loads(response.read())
         except urllib.error.HTTPError as e:
-            return json.loads(e.read().decode())
+            return json_loads(e.read())
+
+
+def exit_code(result: dict[str, Any], key: str = "success") -> int:
+    """Return the process exit code for a response's success flag."""
+    return 0 if result.get(key) else 1
+
+
+def http_get_cached(url: str, endpoint: str, cache_ms: int) -> dict[str, Any]:
+    """GET an endpoint, reusing a response cached less than cache_ms ago.
+
+    Without a cache window the cached response is dropped, so a later
+    cached call never sees data older than the last uncached one.
+    """
+    cache_file = CACHE_DIR / f"{endpoint}.json"
+    if cache_ms <= 0:
+        cache_file.unlink(missing_ok=True)
+        return http_get(f"{url}/{endpoint}")
+
+    now = time.time_ns()
+    try:
+        cached = json_loads(cache_file.read_bytes())
+        if cached["url"] == url and 0 <= now - cached["fetched_at"] < cache_ms * 1_000_000:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    result = http_get(f"{url}/{endpoint}")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_bytes(json_dumps({"url": url, "fetched_at": now, "data": result}))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return result
+
+
+def print_raw(url: str, endpoint: str) -> int:
+    """Write an endpoint's JSON response to stdout without re-encoding it."""
+    # An uncached call, like http_get_cached without a window
+    (CACHE_DIR / f"{endpoint}.json").unlink(missing_ok=True)
+    body, headers = http_get_response(f"{url}/{endpoint}")
+    sys.stdout.buffer.write(body)
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+    connected = headers.get("X-Connected")
+    if connected is not None:
+        return 0 if connected == "1" else 1
+    # Only /connected sends the header, and older control servers don't
+    return exit_code(json_loads(body), "connected")
 
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Get panel status."""
-    result = http_get(f"{args.url}/status")
+    if args.raw:
+        return print_raw(args.url, "status")
+    result = http_get_cached(args.url, "status", args.cache_ms)
     print_json(result)
-    return 0 if result.get("connected") else 1
+    return exit_code(result, "connected")
 
 
 def cmd_connected(args: argparse.Namespace) -> int:
     """Check if panel is connected."""
-    result = http_get(f"{args.url}/connected")
+    if args.quiet:
+        # Exit code only, from the X-Connected header of a HEAD request
+        connected = http_head_header(f"{args.url}/connected", "X-Connected")
+        if connected is not None:
+            return 0 if connected == "1" else 1
+        # Older control servers don't send the header
+        return exit_code(http_get(f"{args.url}/connected"), "connected")
+    if args.raw:
+        return print_raw(args.url, "connected")
+    result = http_get_cached(args.url, "connected", args.cache_ms)
     print_json(result)
-    return 0 if result.get("connected") else 1
+    return exit_code(result, "connected")
+
+
+def parse_hex(text: str) -> str:
+    """Parse a raw hex command and return it as compact hex."""
+    # Parse locally so malformed input fails before any request is made
+    try:
+        command = bytes.fromhex(HEX_SEPARATORS.sub("", text))
+    except ValueError as err:
+        raise ValueError(f"Invalid hex command '{text}': {err}") from None
+    if not command:
+        raise ValueError("Empty command")
+
+    # Compact hex, so the server has no separators to strip
+    return command.hex()
+
+
+# Subcommand -> request body fields taken from its arguments; also the
+# subcommands that can be batched
+COMMAND_FIELDS: dict[str, tuple[str, ...]] = {
+    "status": (),
+    "raw": ("password",),
+    "arm": ("partition", "stay", "password"),
+    "disarm": ("partition", "password"),
+    "stay": ("password",),
+    "siren": ("action",),
+    "pgm": ("number", "action"),
+}
+
+
+def command_data(args: argparse.Namespace) -> dict[str, Any]:
+    """Build the request body for a parsed subcommand, skipping unset options."""
+    data = {
+        field: value
+        for field in COMMAND_FIELDS[args.command]
+        if (value := getattr(args, field))
+    }
+    if args.command == "raw":
+        data["command"] = parse_hex(args.hex)
+    return data
+
+
+def cmd_poll(args: argparse.Namespace) -> int:
+    """Poll panel status repeatedly over the shared connection."""
+    connected = False
+    polls = 0
+    try:
+        while True:
+            result = http_get(f"{args.url}/status")
+            print_json(result)
+            connected = bool(result.get("connected"))
+            polls += 1
+            if args.count and polls >= args.count:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0 if connected else 1
 
 
 def cmd_raw(args: argparse.Namespace) -> int:
     """Send raw command."""
-    data = {"command": args.hex}
-    if args.password:
-        data["password"] = args.password
-
-    result = http_post(f"{args.url}/command/raw", data)
+    result = http_post(f"{args.url}/command/raw", command_data(args))
     print_json(result)
-    return 0 if result.get("success") else 1
+    return exit_code(result)
 
 
 def cmd_arm(args: argparse.Namespace) -> int:
     """Arm panel or partition."""
-    data: dict[str, Any] = {}
-    if args.partition:
-        data["partition"] = args.partition
-    if args.stay:
-        data["stay"] = True
-    if args.password:
-        data["password"] = args.password
-
-    result = http_post(f"{args.url}/command/arm", data)
+    result = http_post(f"{args.url}/command/arm", command_data(args))
     print_json(result)
-    return 0 if result.get("success") else 1
+    return exit_code(result)
 
 
 def cmd_disarm(args: argparse.Namespace) -> int:
     """Disarm panel or partition."""
-    data: dict[str, Any] = {}
-    if args.partition:
-        data["partition"] = args.partition
-    if args.password:
-        data["password"] = args.password
-
-    result = http_post(f"{args.url}/command/disarm", data)
+    result = http_post(f"{args.url}/command/disarm", command_data(args))
     print_json(result)
-    return 0 if result.get("success") else 1
+    return exit_code(result)
 
 
 def cmd_stay(args: argparse.Namespace) -> int:
     """Arm in stay mode."""
-    data: dict[str, Any] = {}
-    if args.password:
-        data["password"] = args.password
-
-    result = http_post(f"{args.url}/command/stay", data)
+    result = http_post(f"{args.url}/command/stay", command_data(args))
     print_json(result)
-    return 0 if result.get("success") else 1
+    return exit_code(result)
 
 
 def cmd_siren(args: argparse.Namespace) -> int:
     """Control siren."""
-    result = http_post(f"{args.url}/command/siren", {"action": args.action})
+    result = http_post(f"{args.url}/command/siren", command_data(args))
     print_json(result)
-    return 0 if result.get("success") else 1
+    return exit_code(result)
 
 
 def cmd_pgm(args: argparse.Namespace) -> int:
     """Control PGM output."""
-    result = http_post(f"{args.url}/command/pgm", {
-        "number": args.number,
-        "action": args.action,
-    })
+    result = http_post(f"{args.url}/command/pgm", command_data(args))
     print_json(result)
-    return 0 if result.get("success") else 1
+    return exit_code(result)
 
 
-def main() -> int:
-    """Main entry point."""
+def cmd_batch(args: argparse.Namespace) -> int:
+    """Send several commands in a single request."""
+    if args.file:
+        # JSON list of {"type": ..., ...} objects, as accepted by the server
+        if args.file == "-":
+            source, raw = "stdin", sys.stdin.buffer.read()
+        else:
+            source, raw = args.file, Path(args.file).read_bytes()
+        try:
+            commands = json_loads(raw)
+        except ValueError as e:
+            print(f"Error: {source} is not valid JSON: {e}", file=sys.stderr)
+            return 1
+        if not isinstance(commands, list) or not all(
+            isinstance(command, dict) for command in commands
+        ):
+            print(
+                f"Error: {source} must contain a JSON list of command objects",
+                file=sys.stderr,
+            )
+            return 1
+    else:
+        # Each -c is a subcommand line, e.g. "arm -P A -p 1234"
+        parser = build_parser()
+        subs = [parser.parse_args(shlex.split(line)) for line in args.commands]
+        for sub in subs:
+            if sub.command not in COMMAND_FIELDS:
+                print(f"Error: '{sub.command}' cannot be batched", file=sys.stderr)
+                return 1
+        commands = [{"type": sub.command, **command_data(sub)} for sub in subs]
+
+    for index, command in enumerate(commands):
+        command.setdefault("id", index)
+
+    result = http_post(f"{args.url}/command/batch", {"commands": commands})
+    if "results" not in result:
+        print_json(result)
+        return 1
+    print_json_lines(result["results"])
+    return exit_code(result)
+
+
+# Subcommand -> handler
+COMMANDS = {
+    "status": cmd_status,
+    "connected": cmd_connected,
+    "poll": cmd_poll,
+    "raw": cmd_raw,
+    "arm": cmd_arm,
+    "disarm": cmd_disarm,
+    "stay": cmd_stay,
+    "siren": cmd_siren,
+    "pgm": cmd_pgm,
+    "batch": cmd_batch,
+}
+
+
+@lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (once; batch reuses it per command)."""
     parser = argparse.ArgumentParser(
         description="CLI tool for Intelbras AMT integration testing",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   %(prog)s status              Get panel status
+  %(prog)s poll -i 2 -n 10     Print status every 2 s, 10 times
   %(prog)s raw "5B"            Send status command (0x5B)
   %(prog)s raw "41 35" -p 1234 Test partition A stay mode
   %(prog)s arm --stay          Arm in stay mode
   %(prog)s arm -P A --stay     Arm partition A in stay mode
   %(prog)s disarm -p 1234      Disarm with password
+  %(prog)s batch -c "arm -P A -p 1234" -c "siren on"
+                               Send several commands in one request
         """,
     )
     parser.add_argument(
@@ -180,62 +481,107 @@ Examples:
         default=DEFAULT_URL,
         help=f"Control server URL (default: {DEFAULT_URL})",
     )
+    parser.add_argument(
+        "--pool-max",
+        type=int,
+        default=DEFAULT_POOL_MAX,
+        metavar="N",
+        help=f"Idle connections kept open, httpx only (default: {DEFAULT_POOL_MAX})",
+    )
+    parser.add_argument(
+        "--keepalive-expiry",
+        type=float,
+        default=DEFAULT_KEEPALIVE_EXPIRY,
+        metavar="SECS",
+        help=(
+            "Seconds an idle connection is kept open, httpx only "
+            f"(default: {DEFAULT_KEEPALIVE_EXPIRY:g})"
+        ),
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # status command
     status_parser = subparsers.add_parser("status", help="Get panel status")
-    status_parser.set_defaults(func=cmd_status)
+    status_output = status_parser.add_mutually_exclusive_group()
+    status_output.add_argument("--cache-ms", type=int, default=0, metavar="MS",
+                               help="Reuse a response fetched less than MS ms ago")
+    status_output.add_argument("--raw", action="store_true",
+                               help="Print the server's JSON as received")
 
     # connected command
     connected_parser = subparsers.add_parser("connected", help="Check if panel is connected")
-    connected_parser.set_defaults(func=cmd_connected)
+    connected_output = connected_parser.add_mutually_exclusive_group()
+    connected_output.add_argument("--cache-ms", type=int, default=0, metavar="MS",
+                                  help="Reuse a response fetched less than MS ms ago")
+    connected_output.add_argument("--raw", action="store_true",
+                                  help="Print the server's JSON as received")
+    connected_output.add_argument("--quiet", "-q", action="store_true",
+                                  help="Print nothing; only set the exit code")
+
+    # poll command
+    poll_parser = subparsers.add_parser("poll", help="Poll panel status repeatedly")
+    poll_parser.add_argument("--interval", "-i", type=float, default=1.0,
+                            help="Seconds between polls (default: 1)")
+    poll_parser.add_argument("--count", "-n", type=int, default=0,
+                            help="Number of polls (default: until interrupted)")
 
     # raw command
     raw_parser = subparsers.add_parser("raw", help="Send raw hex command")
-    raw_parser.add_argument("hex", help="Command as hex string (e.g., '41 35' or 'A5')")
+    raw_parser.add_argument("hex", help="Command as hex string (e.g., '41 35', '41:35', '41-35' or 'A5')")
     raw_parser.add_argument("--password", "-p", help="Password override")
-    raw_parser.set_defaults(func=cmd_raw)
 
     # arm command
     arm_parser = subparsers.add_parser("arm", help="Arm panel or partition")
-    arm_parser.add_argument("--partition", "-P", choices=["A", "B", "C", "D"],
+    arm_parser.add_argument("--partition", "-P", choices=PARTITIONS,
                            help="Partition to arm (A/B/C/D)")
     arm_parser.add_argument("--stay", "-s", action="store_true",
                            help="Arm in stay mode")
     arm_parser.add_argument("--password", "-p", help="Password")
-    arm_parser.set_defaults(func=cmd_arm)
 
     # disarm command
     disarm_parser = subparsers.add_parser("disarm", help="Disarm panel or partition")
-    disarm_parser.add_argument("--partition", "-P", choices=["A", "B", "C", "D"],
+    disarm_parser.add_argument("--partition", "-P", choices=PARTITIONS,
                               help="Partition to disarm (A/B/C/D)")
     disarm_parser.add_argument("--password", "-p", help="Password")
-    disarm_parser.set_defaults(func=cmd_disarm)
 
     # stay command
     stay_parser = subparsers.add_parser("stay", help="Arm in stay mode")
     stay_parser.add_argument("--password", "-p", help="Password")
-    stay_parser.set_defaults(func=cmd_stay)
 
     # siren command
     siren_parser = subparsers.add_parser("siren", help="Control siren")
-    siren_parser.add_argument("action", choices=["on", "off"],
+    siren_parser.add_argument("action", choices=ON_OFF,
                              help="Siren action (on/off)")
-    siren_parser.set_defaults(func=cmd_siren)
 
     # pgm command
     pgm_parser = subparsers.add_parser("pgm", help="Control PGM output")
-    pgm_parser.add_argument("number", type=int, choices=range(1, 20),
+    pgm_parser.add_argument("number", type=int, choices=PGM_NUMBERS,
                            metavar="N", help="PGM number (1-19)")
-    pgm_parser.add_argument("action", choices=["on", "off"],
+    pgm_parser.add_argument("action", choices=ON_OFF,
                            help="PGM action (on/off)")
-    pgm_parser.set_defaults(func=cmd_pgm)
 
-    args = parser.parse_args()
+    # batch command
+    batch_parser = subparsers.add_parser(
+        "batch", help="Send several commands in one request"
+    )
+    batch_source = batch_parser.add_mutually_exclusive_group(required=True)
+    batch_source.add_argument("--command", "-c", action="append", dest="commands",
+                              metavar="COMMAND",
+                              help="Subcommand line, e.g. \"pgm 1 on\" (repeatable)")
+    batch_source.add_argument("--file", "-f",
+                              help="JSON file with a list of commands ('-' for stdin)")
+
+    return parser
+
+
+def main() -> int:
+    """Main entry point."""
+    args = build_parser().parse_args()
+    configure_client(args.pool_max, args.keepalive_expiry)
 
     try:
-        return args.func(args)
+        return COMMANDS[args.command](args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1